@@ -1,172 +1,311 @@
+import concurrent.futures
+import functools
 import logging
-import tomllib
+import logging.handlers
+import fnmatch
 import glob
 import os
 import sys
-from datetime import datetime
+import threading
+from collections.abc import Callable, Iterator
+from datetime import date, datetime
 from typing import Optional
 
+from src import fastjson, fasttoml
+from src.config import AppConfig, ConfigError, LogConfig, ServiceNowConfig
+from src.env import Credentials, credentials
 from src.servicenow import ServiceNowClient, ServiceNowIntegrationClient
-from src.template import TicketTemplate
+from src.template import TicketTemplate, create_tickets_in_batch
 
 
-# --- Default Log Config (if config.toml is missing or incomplete) ---
-DEFAULT_LOG_LEVEL = "INFO"
-DEFAULT_LOG_DIR = "logs"
-DEFAULT_LOG_FILENAME_TEMPLATE = "app_%Y_%m_%d.log"
+# Number of records buffered before they are written to the log file
+LOG_BUFFER_CAPACITY = 1024
 
+# --- Log formats: detailed for the file, message only for the console ---
+FILE_LOG_FORMATTER = logging.Formatter("{asctime} - {name} - {levelname} - {message}", datefmt="%Y-%m-%d %H:%M:%S", style="{")
+CONSOLE_LOG_FORMATTER = logging.Formatter("{message}", style="{")
 
-def setup_logging(log_config: dict):
+
+class FastJsonFormatter(logging.Formatter):
+    """Formats records as one JSON object per line, without strftime or %-substitution of the record fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {"ts": record.created, "lvl": record.levelname, "name": record.name, "msg": record.getMessage()}
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return fastjson.dumps(entry).decode("utf-8")
+
+
+log = logging.getLogger()  # The root logger, so file log lines keep the 'root' name
+
+
+def setup_logging(log_config: LogConfig):
     """
     Configures logging with separate formats for file and console.
     File logs will be detailed, while console logs will show only the message.
     """
-    log_level_str = log_config.get("level", DEFAULT_LOG_LEVEL).upper()
-    log_dir = log_config.get("dir", DEFAULT_LOG_DIR)
-    filename_template = log_config.get("filename_template", DEFAULT_LOG_FILENAME_TEMPLATE)
-
-    level_map = {
-        "DEBUG": logging.DEBUG,
-        "INFO": logging.INFO,
-        "WARNING": logging.WARNING,
-        "ERROR": logging.ERROR,
-        "CRITICAL": logging.CRITICAL,
-    }
-    numeric_log_level = level_map.get(log_level_str, logging.INFO)
+    log_level_str = log_config.level.upper()
+    log_dir = log_config.dir
+    filename_template = log_config.filename_template
+
+    numeric_log_level = logging.getLevelName(log_level_str)
+    if not isinstance(numeric_log_level, int):
+        numeric_log_level = logging.INFO
 
     try:
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
+        os.makedirs(log_dir, exist_ok=True)
     except OSError as e:
-        print(f"Warning: Could not create log directory {log_dir}: {e}. Logging to current directory.")
+        report_problems([f"WARNING: Could not create log directory {log_dir}: {e}. Logging to current directory."])
         log_dir = "."
 
     # Format the filename with the current date
     log_filename = datetime.now().strftime(filename_template)
-    log_file_path = os.path.join(log_dir, log_filename)
+    log_file_path = f"{log_dir.rstrip(os.sep)}{os.sep}{log_filename}"
 
     # Get the root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(numeric_log_level)
 
     # Remove any existing handlers from the root logger to avoid duplicate messages
-    if root_logger.hasHandlers():
-        for handler in root_logger.handlers[:]:
-            root_logger.removeHandler(handler)
-            handler.close()
+    for handler in root_logger.handlers:
+        # MemoryHandler.close() flushes to its target and then drops it, so the target is taken first
+        target = handler.target if isinstance(handler, logging.handlers.MemoryHandler) else None
+        handler.close()
+        if target is not None:
+            target.close()
+    root_logger.handlers.clear()
 
     # --- Configure File Handler (detailed logging) ---
-    file_handler = logging.FileHandler(log_file_path)
-    file_formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
-    file_handler.setFormatter(file_formatter)
-    root_logger.addHandler(file_handler)
+    # Records are buffered in memory and written in batches; errors are written immediately.
+    # logging.shutdown() flushes the buffer when the application exits.
+    # The file is only created once the first record is written, so quiet runs touch no disk.
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file_path,
+        maxBytes=log_config.max_bytes,
+        backupCount=log_config.backup_count,
+        delay=True,
+    )
+    file_handler.setFormatter(FastJsonFormatter() if log_config.format == "json" else FILE_LOG_FORMATTER)
+    buffered_file_handler = logging.handlers.MemoryHandler(
+        capacity=LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=file_handler
+    )
+    root_logger.addHandler(buffered_file_handler)
 
     # --- Configure Console Handler (message only) ---
     console_handler = logging.StreamHandler(sys.stdout)
-    console_formatter = logging.Formatter("%(message)s")
-    console_handler.setFormatter(console_formatter)
+    console_handler.setFormatter(CONSOLE_LOG_FORMATTER)
     root_logger.addHandler(console_handler)
 
-    logging.info(f"Logging configured. Level: {log_level_str}. Log file: {log_file_path}")
+    log.info("Logging configured. Level: %s. Log file: %s", log_level_str, log_file_path)
+
+
+def report_problems(problems: list[str]) -> None:
+    """Writes messages produced before logging is configured to stderr in a single write."""
+    if problems:
+        sys.stderr.write("\n".join(problems) + "\n")
 
 
-def load_app_config(config_path="config.toml"):
+def load_app_config(config_path="config.toml") -> AppConfig:
     app_config = None
+    toml_loads, toml_decode_errors = fasttoml.backend()
+    problems = []
+    fatal = False
 
     try:
-        with open(config_path, "rb") as f:
-            app_config = tomllib.load(f)
+        with open(config_path, "r", encoding="utf-8") as f:
+            app_config = toml_loads(f.read())
 
         if "log" not in app_config:
-            print(f"WARNING: Log configuration ('log' section) not found in {config_path} - Using default logging settings.")
+            problems.append(f"WARNING: Log configuration ('log' section) not found in {config_path} - Using default logging settings.")
 
         if "templates" not in app_config:
-            print(f"ERROR: Templates configuration ('templates' section) not found in {config_path} - Exiting.")
-            sys.exit(1)
+            problems.append(f"ERROR: Templates configuration ('templates' section) not found in {config_path} - Exiting.")
+            fatal = True
         if "servicenow" not in app_config:
-            print(f"ERROR: ServiceNow configuration ('servicenow' section) not found in {config_path} - Exiting.")
-            sys.exit(1)
+            problems.append(f"ERROR: ServiceNow configuration ('servicenow' section) not found in {config_path} - Exiting.")
+            fatal = True
 
+        if not fatal:
+            # Types, unknown fields and the log filename template are checked here, once
+            app_config = AppConfig.from_dict(app_config)
+
+    except ConfigError as e:
+        problems.append(f"ERROR: Invalid configuration in {config_path}: {e} - Exiting.")
+        fatal = True
     except FileNotFoundError:
-        print(f"ERROR: Configuration file {config_path} not found - Exiting.")
-        sys.exit(1)
-    except tomllib.TOMLDecodeError as e:
-        print(f"ERROR: Error decoding TOML from {config_path}: {e} - Exiting.")
-        sys.exit(1)
+        problems.append(f"ERROR: Configuration file {config_path} not found - Exiting.")
+        fatal = True
+    except toml_decode_errors as e:
+        problems.append(f"ERROR: Error decoding TOML from {config_path}: {e} - Exiting.")
+        fatal = True
     except Exception as e:  # Catch any other unexpected errors during loading
-        print(f"ERROR: An unexpected error occurred while loading configuration from {config_path}: {e} - Exiting.")
+        problems.append(f"ERROR: An unexpected error occurred while loading configuration from {config_path}: {e} - Exiting.")
+        fatal = True
+
+    report_problems(problems)
+    if fatal:
         sys.exit(1)
 
     return app_config
 
 
+def iter_templates(pattern: str) -> Iterator[str]:
+    """
+    Lazily yields the template files matching `pattern` (e.g. ".\\resources\\*.toml").
+    If only the file name part has wildcards, the directory is scanned once with os.scandir;
+    wildcards in the directory part are expanded with glob.
+    """
+    template_dir, name_pattern = os.path.split(pattern)
+    if glob.has_magic(template_dir):
+        for path in glob.iglob(pattern):
+            if os.path.isfile(path):
+                yield path
+        return
+
+    hidden_allowed = name_pattern.startswith(".")  # Same as glob: wildcards don't match dotfiles
+
+    try:
+        with os.scandir(template_dir or ".") as entries:
+            for entry in entries:
+                if entry.name.startswith(".") and not hidden_allowed:
+                    continue
+                if fnmatch.fnmatch(entry.name, name_pattern) and entry.is_file():
+                    yield entry.path
+    except OSError as e:
+        log.error("Could not read templates directory %s: %s", template_dir, e)
+
+
+def integration_client_factory(
+    sn_config: ServiceNowConfig, creds: Credentials
+) -> Callable[[], Optional[ServiceNowIntegrationClient]]:
+    """
+    Returns a thread-safe factory that builds the ServiceNowIntegrationClient on first use.
+    The factory returns None if no integration URL is configured or the client could not be created.
+    """
+    lock = threading.Lock()
+
+    @functools.cache
+    def build() -> Optional[ServiceNowIntegrationClient]:
+        if not sn_config.integration_url.strip():
+            return None
+        try:
+            return ServiceNowIntegrationClient(
+                url=sn_config.instance_url,
+                integration_path=sn_config.integration_url,
+                username=creds.integration_user,
+                password=creds.integration_password,
+            )
+        except Exception as e:
+            log.error("Error initializing ServiceNow integration client: %s", e)
+            return None
+
+    def get_integration_client() -> Optional[ServiceNowIntegrationClient]:
+        with lock:
+            return build()
+
+    return get_integration_client
+
+
+def _load_due_template(file: str, today: date) -> Optional[TicketTemplate]:
+    """Loads a single template and, if a ticket is due today, validates it. Returns the template if it is due and valid, else None."""
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Processing template: %s", file)
+    template = TicketTemplate(template_path=file)
+    if not template.load():
+        return None
+
+    # The schedule check is cheap; only templates that are due get fully validated
+    if not template.is_due(today):
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Schedule conditions not met for template. No ticket created.")
+        return None
+
+    if not template.validate_structure():
+        return None
+    return template
+
+
 def main():
     # --- Get ServiceNow credentials from environment variables ---
-    sn_api_user = os.environ.get("SN_API_USER")
-    sn_api_pass = os.environ.get("SN_API_PASSWORD")
-
-    if not sn_api_user or not sn_api_pass:
-        print("ERROR: SN_API_USER or SN_API_PASSWORD environment variables not set. Exiting.")
+    try:
+        creds = credentials()
+    except ValueError as e:
+        report_problems([f"ERROR: {e} Exiting."])
         sys.exit(1)
-    
-    # --- Get ServiceNow integration credentials from environment variables ---
-    sn_integration_user = os.environ.get("SN_INTEGRATION_USER")
-    sn_integration_pass = os.environ.get("SN_INTEGRATION_PASSWORD")
 
-    if not sn_integration_user or not sn_integration_pass:
-        print("WARNING: SN_INTEGRATION_USER or SN_INTEGRATION_PASSWORD not set. The ServiceNow integration will use the primary API credentials (SN_API_USER/SN_API_PASSWORD) as a fallback.")
-        sn_integration_user = sn_api_user
-        sn_integration_pass = sn_api_pass
+    if creds.integration_fallback:
+        report_problems(["WARNING: SN_INTEGRATION_USER or SN_INTEGRATION_PASSWORD not set. The ServiceNow integration will use the primary API credentials (SN_API_USER/SN_API_PASSWORD) as a fallback."])
 
     # --- Load application configuration ---
     config = load_app_config("config.toml")
-    sn_config = config.get("servicenow", {})
-    templates_config = config.get("templates", {})
 
-    setup_logging(config.get("log", {}))
-    templates = glob.glob(templates_config.get("path"))
-    logging.debug(f"Found templates: {templates}")
+    setup_logging(config.log)
+    templates = iter_templates(config.templates.path)
+    if log.isEnabledFor(logging.DEBUG):
+        templates = list(templates)
+        log.debug("Found templates: %s", templates)
 
-    today = datetime.now()
-    logging.debug(f"Today's date: {today}.")
+    today = date.today()
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Today's date: %s.", today)
 
     # --- ServiceNow clients ---
     try:
         sn_client = ServiceNowClient(
-            url=sn_config.get("instance_url"),
-            username=sn_api_user,
-            password=sn_api_pass,
+            url=config.servicenow.instance_url,
+            username=creds.api_user,
+            password=creds.api_password,
         )
     except Exception as e:
-        logging.error(f"Error initializing ServiceNow client: {e}")
+        log.error("Error initializing ServiceNow client: %s", e)
         sys.exit(1)
     
-    sn_integration_client = None 
-    if sn_config.get("integration_url", "").strip():
-        try:
-            sn_integration_client = ServiceNowIntegrationClient(
-                url=sn_config.get("instance_url"),
-                integration_path=sn_config.get("integration_url"),
-                username=sn_integration_user,
-                password=sn_integration_pass,
-            )
-        except Exception as e:
-            logging.error(f"Error initializing ServiceNow integration client: {e}")
-            return
+    get_integration_client = integration_client_factory(config.servicenow, creds)
 
-    # --- Process each template file ---
+    # --- Load and validate templates (cheap, local) ---
+    due_templates = []
     for file in templates:
-        logging.debug(f"Processing template: {file}")
-        template = TicketTemplate(template_path=file)
-        if not template.load():
+        try:
+            template = _load_due_template(file, today)
+        except Exception as e:
+            log.error("Unexpected error while processing template %s: %s", file, e, exc_info=True)
             continue
-
-        if template.validate_structure():
-            if template.is_due(today):
-                logging.info(f"Creating ticket based on template {file}.")
-                template.create_ticket(sn_api_client=sn_client, sn_integration_client=sn_integration_client)
-            else:
-                logging.debug(f"Schedule conditions not met for template. No ticket created.")
+        if template is not None:
+            if not due_templates:
+                # The first due ticket: open the connections while the remaining templates load
+                sn_client.start_warm_up()
+            due_templates.append(template)
+
+    # --- Create the due tickets (network-bound, run concurrently) ---
+    if not due_templates:
+        return
+
+    # Tickets created through the primary API share Batch API round-trips; the integration helper can't be batched
+    batched_templates = [template for template in due_templates if not template.integration_helper]
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=config.templates.max_workers) as pool:
+        futures = {}
+        if batched_templates:
+            log.info("Creating tickets based on %d template(s) in batch.", len(batched_templates))
+            future = pool.submit(create_tickets_in_batch, batched_templates, sn_client)
+            futures[future] = ", ".join(template.template_path for template in batched_templates)
+
+        for template in due_templates:
+            if not template.integration_helper:
+                continue
+            log.info("Creating ticket based on template %s.", template.template_path)
+            future = pool.submit(
+                template.create_ticket, sn_api_client=sn_client, sn_integration_client=get_integration_client
+            )
+            futures[future] = template.template_path
+
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                log.error(
+                    "Unexpected error while creating ticket for template %s: %s", futures[future], e, exc_info=True
+                )
 
 
 if __name__ == "__main__":
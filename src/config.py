@@ -0,0 +1,119 @@
+from dataclasses import MISSING, dataclass, field, fields
+from datetime import datetime
+
+
+# --- Defaults for optional settings in config.toml ---
+DEFAULT_LOG_LEVEL = "INFO"
+DEFAULT_LOG_DIR = "logs"
+DEFAULT_LOG_FILENAME_TEMPLATE = "app_%Y_%m_%d.log"
+DEFAULT_LOG_MAX_BYTES = 0  # 0 disables size-based rotation
+DEFAULT_LOG_BACKUP_COUNT = 0
+DEFAULT_LOG_FORMAT = "text"
+LOG_FORMATS = ("text", "json")
+DEFAULT_MAX_WORKERS = 8  # Number of due tickets created concurrently
+
+
+class ConfigError(ValueError):
+    """Raised when config.toml has missing, unknown or wrongly typed fields."""
+
+
+@dataclass(frozen=True)
+class LogConfig:
+    """The `[log]` section of config.toml."""
+
+    level: str = DEFAULT_LOG_LEVEL
+    dir: str = DEFAULT_LOG_DIR
+    filename_template: str = DEFAULT_LOG_FILENAME_TEMPLATE
+    max_bytes: int = DEFAULT_LOG_MAX_BYTES
+    backup_count: int = DEFAULT_LOG_BACKUP_COUNT
+    format: str = DEFAULT_LOG_FORMAT
+
+
+@dataclass(frozen=True)
+class ServiceNowConfig:
+    """The `[servicenow]` section of config.toml."""
+
+    instance_url: str
+    integration_url: str = ""
+
+
+@dataclass(frozen=True)
+class TemplatesConfig:
+    """The `[templates]` section of config.toml."""
+
+    path: str
+    max_workers: int = DEFAULT_MAX_WORKERS
+
+
+@dataclass(frozen=True)
+class AppConfig:
+    """Typed view of config.toml, validated once when it is loaded."""
+
+    servicenow: ServiceNowConfig
+    templates: TemplatesConfig
+    log: LogConfig = field(default_factory=LogConfig)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "AppConfig":
+        """Builds the configuration from a parsed config.toml.
+
+        Args:
+            data (dict): The parsed TOML document.
+
+        Returns:
+            AppConfig: The validated configuration.
+
+        Raises:
+            ConfigError: If a section or field is missing, unknown or has the wrong type,
+                if `log.filename_template` is not a valid strftime template, or if `log.format`
+                is not one of LOG_FORMATS.
+        """
+        log_config = _build_section(LogConfig, "log", data.get("log", {}))
+        try:
+            datetime.now().strftime(log_config.filename_template)
+        except ValueError as e:
+            raise ConfigError(f"Invalid 'log.filename_template': {e}") from e
+        if log_config.format not in LOG_FORMATS:
+            raise ConfigError(f"Invalid 'log.format' value '{log_config.format}'. Allowed: {list(LOG_FORMATS)}")
+
+        templates_config = _build_section(TemplatesConfig, "templates", data.get("templates"))
+        if templates_config.max_workers < 1:
+            raise ConfigError("'templates.max_workers' must be at least 1.")
+
+        return cls(
+            servicenow=_build_section(ServiceNowConfig, "servicenow", data.get("servicenow")),
+            templates=templates_config,
+            log=log_config,
+        )
+
+
+def _build_section(section_cls: type, name: str, data: dict | None):
+    """Validates a single config section against its dataclass and instantiates it."""
+    if data is None:
+        raise ConfigError(f"'{name}' section is missing.")
+    if not isinstance(data, dict):
+        raise ConfigError(f"'{name}' must be a table (found: {type(data).__name__}).")
+
+    known_fields = {f.name: f for f in fields(section_cls)}
+
+    unknown = sorted(data.keys() - known_fields.keys())
+    if unknown:
+        raise ConfigError(f"Unknown field(s) in '{name}' section: {unknown}.")
+
+    missing = [
+        f.name
+        for f in known_fields.values()
+        if f.name not in data and f.default is MISSING and f.default_factory is MISSING
+    ]
+    if missing:
+        raise ConfigError(f"Missing required field(s) in '{name}' section: {missing}.")
+
+    for key, value in data.items():
+        expected = known_fields[key].type
+        # bool is a subclass of int, but `max_workers = true` is not a valid setting
+        if not isinstance(value, expected) or (expected is int and isinstance(value, bool)):
+            raise ConfigError(
+                f"'{name}.{key}' must be of type {expected.__name__} (found: {type(value).__name__})."
+            )
+
+    return section_cls(**data)
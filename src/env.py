@@ -0,0 +1,63 @@
+import functools
+import os
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Credentials:
+    """ServiceNow credentials read from the environment.
+
+    Attributes:
+        api_user (str): Username for the standard ServiceNow API.
+        api_password (str): Password for the standard ServiceNow API.
+        integration_user (str): Username for the integration helper endpoint.
+        integration_password (str): Password for the integration helper endpoint.
+        integration_fallback (bool): True if the integration credentials were not set
+            and the API credentials are used in their place.
+    """
+
+    api_user: str
+    api_password: str
+    integration_user: str
+    integration_password: str
+    integration_fallback: bool = False
+
+
+@functools.cache
+def credentials() -> Credentials:
+    """Reads the ServiceNow credentials from the environment once per process.
+
+    If `SN_INTEGRATION_USER` or `SN_INTEGRATION_PASSWORD` is not set, the
+    primary API credentials are used for the integration client as well.
+
+    Returns:
+        Credentials: The (cached) credentials.
+
+    Raises:
+        ValueError: If `SN_API_USER` or `SN_API_PASSWORD` is not set.
+    """
+    env = os.environ.copy()  # Plain dict snapshot; cheaper to query than the os.environ mapping
+    api_user = env.get("SN_API_USER")
+    api_password = env.get("SN_API_PASSWORD")
+
+    if not api_user or not api_password:
+        raise ValueError("SN_API_USER or SN_API_PASSWORD environment variables not set.")
+
+    integration_user = env.get("SN_INTEGRATION_USER")
+    integration_password = env.get("SN_INTEGRATION_PASSWORD")
+
+    if not integration_user or not integration_password:
+        return Credentials(
+            api_user=api_user,
+            api_password=api_password,
+            integration_user=api_user,
+            integration_password=api_password,
+            integration_fallback=True,
+        )
+
+    return Credentials(
+        api_user=api_user,
+        api_password=api_password,
+        integration_user=integration_user,
+        integration_password=integration_password,
+    )
@@ -0,0 +1,23 @@
+import json
+
+try:
+    import orjson  # Optional Rust-backed JSON library, noticeably faster than json
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    JSONDecodeError = orjson.JSONDecodeError  # Subclass of json.JSONDecodeError
+    loads = orjson.loads
+
+    def dumps(obj) -> bytes:
+        """Serializes `obj` to compact UTF-8 encoded JSON."""
+        return orjson.dumps(obj)
+
+else:
+    JSONDecodeError = json.JSONDecodeError
+    loads = json.loads
+
+    def dumps(obj) -> bytes:
+        """Serializes `obj` to compact UTF-8 encoded JSON."""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
@@ -0,0 +1,15 @@
+import functools
+
+
+@functools.cache
+def backend():
+    """
+    Selects the TOML parser on first use: rtoml (optional, Rust-backed) if installed, otherwise tomllib.
+    Returns a (loads, decode_errors) tuple; `loads` takes a str.
+    """
+    try:
+        import rtoml
+        return rtoml.loads, (rtoml.TomlParsingError,)
+    except ImportError:
+        import tomllib
+        return tomllib.loads, (tomllib.TOMLDecodeError,)
@@ -1,26 +1,292 @@
+import base64
+import concurrent.futures
+import contextlib
+import copy
+import functools
+import itertools
 import os
+import threading
+import time
+import uuid
 import mimetypes  # For guessing MIME type
 import logging
-import json
 import requests
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Mapping
+from types import MappingProxyType
+from urllib.parse import urlencode
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.exceptions import NewConnectionError
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+from src import fastjson
 
 
 module_logger = logging.getLogger(__name__)
 
+# --- HTTP connection pool and retry policy ---
+POOL_MAXSIZE = 32  # Connections kept alive per host and session; above the number of concurrent workers
+READ_METHODS = frozenset(["GET", "HEAD"])  # Sent over the read session; everything else is a write
+MAX_CONCURRENT_WRITES = 5  # Creates/updates/uploads in flight at once, per client
+RETRY_STATUS_CODES = frozenset([429, 502, 503, 504])
+RETRY_METHODS = frozenset(["GET", "HEAD", "PUT", "DELETE"])
+
+REQUEST_TIMEOUT = 30  # Seconds to wait for the response to a single API call
+ERROR_BODY_LOG_LIMIT = 2048  # Bytes of a non-JSON error response that are logged
+
+# Record types accepted by get_many, each served by the matching get_<type> method
+LOOKUP_TYPES = frozenset(["incident", "catalog_task", "requested_item", "service_request", "organization", "team"])
+GET_MANY_MAX_WORKERS = 10
+
+# A small set of commonly used fields per table. Full records carry hundreds of columns, so callers that
+# only need these can pass DEFAULT_FIELDS[table] as `fields` to the getters, which return all fields by default.
+DEFAULT_FIELDS = MappingProxyType(
+    {
+        "incident": ("sys_id", "number", "state", "short_description", "assignment_group", "sys_updated_on"),
+        "sc_req_item": ("sys_id", "number", "state", "short_description", "assignment_group", "request", "sys_updated_on"),
+        "sc_request": ("sys_id", "number", "state", "short_description", "requested_for", "sys_updated_on"),
+        "sc_task": ("sys_id", "number", "state", "short_description", "assignment_group", "request_item", "sys_updated_on"),
+    }
+)
+
+# Records looked up by sys_id or number are reused for this long, unless the table is written to
+RECORD_CACHE_TTL = 30
+RECORD_CACHE_MAXSIZE = 1024
+NEGATIVE_CACHE_TTL = 10  # A number or name that matched nothing is remembered for a shorter time
+
+# Batch API: calls sent per round-trip, and the headers every call is sent with
+BATCH_MAX_REQUESTS = 100
+BATCH_TIMEOUT_PER_REQUEST = 2  # Seconds added to REQUEST_TIMEOUT for every call in a batch round-trip
+BATCH_HEADERS = [
+    {"name": "Content-Type", "value": "application/json"},
+    {"name": "Accept", "value": "application/json"},
+]
+
+# Single-record GETs that ask for revalidation keep their response this long, so a later identical
+# GET can be answered with 304. Larger bodies are not kept, which bounds the cache to a few MB.
+ETAG_CACHE_TTL = 3600
+ETAG_CACHE_MAXSIZE = 256
+ETAG_CACHE_MAX_BYTES = 16384
+
+DEFAULT_PAGE_SIZE = 500  # Records per round-trip when paging through query results
+DEFAULT_QUERY_LIMIT = 10000  # Records returned by a query without an explicit limit (the Table API maximum)
+
+# Large result sets: records per page, and pages fetched concurrently once the total is known
+PARALLEL_PAGE_SIZE = 1000
+PAGINATION_MAX_WORKERS = 8
+IN_QUERY_CHUNK_SIZE = 100  # Values per 'IN' query; keeps the request URL well under the instance limit
+
+DEFAULT_CONTENT_TYPE = "application/octet-stream"  # Attachments whose type can't be guessed
+
+
+@functools.lru_cache(maxsize=256)
+def _join_url(base: str, endpoint_segment: str) -> str:
+    """Joins a base URL ending in '/' with an endpoint segment. Cached, as the same few endpoints are used over and over."""
+    return base + endpoint_segment.lstrip("/")
+
+
+class CircuitBreaker:
+    """Fails requests fast while the ServiceNow instance is unreachable.
+
+    After `fail_threshold` consecutive failures the circuit opens and requests are
+    rejected without touching the network. Once `reset_timeout` seconds have passed,
+    a single probe request is let through (half-open): if it succeeds the circuit
+    closes again, otherwise it stays open for another `reset_timeout`. A probe that
+    never reports back (e.g. its caller raised an unexpected exception) is given up on
+    after `reset_timeout` as well, and the next request becomes the new probe.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, fail_threshold: int = 5, reset_timeout: float = 30.0):
+        self.fail_threshold = fail_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0  # When the circuit opened, or when the current probe was let through
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """Returns True if a request may be sent now."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            now = time.monotonic()
+            if now - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                self.opened_at = now
+                return True  # This caller is the probe; others are rejected until it reports back or times out
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.state != self.CLOSED:
+                logging.info("ServiceNow is reachable again. Circuit closed.")
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.fail_threshold:
+                if self.state != self.OPEN:
+                    logging.warning(
+                        f"Circuit opened after {self.failures} consecutive failure(s). "
+                        f"Requests are rejected for {self.reset_timeout} seconds."
+                    )
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+
+class TTLCache:
+    """A small thread-safe LRU cache whose entries expire `ttl` seconds after they were stored."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 30.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (expires_at, value), least recently used first
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Returns the value stored for `key`, or `default` if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value, ttl: float = None) -> None:
+        """Stores `value` for `key`, expiring after `ttl` seconds (defaults to the cache's ttl)."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def evict(self, predicate: Callable[[object], bool]) -> None:
+        """Removes every entry whose key matches `predicate`."""
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+
+# Cached in place of a record for lookups that matched nothing (None means "not cached")
+_MISS = object()
+
+
+class _RequestNotSent(Exception):
+    """Raised instead of returning None when a request provably never reached the instance,
+    so the caller can safely send it again (see `_execute_http_request`'s `raise_unsent`)."""
+
+
+def _never_sent(error: requests.exceptions.ConnectionError) -> bool:
+    """Returns True if a connection error happened before any of the request was sent:
+    the connection could not be established or timed out while connecting."""
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    cause = error.args[0] if error.args else None  # urllib3's MaxRetryError, with the last error as 'reason'
+    return isinstance(cause, NewConnectionError) or isinstance(getattr(cause, "reason", None), NewConnectionError)
+
+
+# Returned for successful responses without a body; shared, so they are read-only
+_SUCCESS_NO_CONTENT = MappingProxyType(
+    {"status": "success", "message": "Operation successful with no content returned."}
+)
+
+
+@functools.cache
+def _success_without_content(status_code: int) -> Mapping:
+    """Returns the shared read-only result for a successful, empty response with the given status."""
+    return MappingProxyType(
+        {"status": "success", "message": f"Operation successful with status {status_code} and no content."}
+    )
+
+
+def _batch_result(result: tuple[int, dict | None] | None):
+    """Returns the 'result' of a successful Batch API sub-request, or None."""
+    if result is None:
+        return None
+    status_code, body = result
+    if status_code is None or not 200 <= status_code < 300 or not body:
+        logging.debug(f"Batch call returned status {status_code}: {body}")
+        return None
+    return body.get("result")
+
+
+@functools.lru_cache(maxsize=128)
+def _guess_content_type(extension: str) -> str:
+    """Returns the MIME type for a file extension (e.g. ".pdf"). Cached, as uploads repeat the same few extensions."""
+    content_type, _ = mimetypes.guess_type(f"file{extension}")
+    return content_type or DEFAULT_CONTENT_TYPE
+
+
+def _request_cache_key(request_url: str, params: dict | None) -> tuple:
+    """Builds the cache key of a GET request, independent of parameter order."""
+    if not params:
+        return (request_url, ())
+    return (request_url, tuple(sorted(params.items())))
+
+
+@functools.lru_cache(maxsize=64)
+def _name_lookup_fields(extra_fields: tuple[str, ...]) -> tuple[str, ...]:
+    """Returns 'sys_id', 'name' and the extra fields, without duplicates, for records looked up by name.
+
+    Cached, as callers ask for the same few field combinations over and over.
+    """
+    return ("sys_id", "name", *sorted(set(extra_fields) - {"sys_id", "name"}))
+
+
+def _escape_query_value(value) -> str:
+    """Escapes a value for use in an encoded query. A literal '^' must be doubled, or ServiceNow reads it as a condition separator.
+
+    Percent-encoding is left to requests, which encodes the whole 'sysparm_query' parameter.
+    """
+    return str(value).replace("^", "^^")
+
 
 class ServiceNowClient:
-    def __init__(self, url: str, username: str, password: str):
+    # Table API endpoints used by the create methods
+    _INCIDENT_ENDPOINT = "table/incident"
+    _RITM_ENDPOINT = "table/sc_req_item"
+
+    # Journal entries (comments and work notes) of a ticket, unordered, oldest or newest first
+    _JOURNAL_QUERY = "element_id={sys_id}^elementINcomments,work_notes"
+    _JOURNAL_QUERY_ASC = _JOURNAL_QUERY + "^ORDERBYsys_created_on"
+    _JOURNAL_QUERY_DESC = _JOURNAL_QUERY + "^ORDERBYDESCsys_created_on"
+    _JOURNAL_FIELDS = (
+        "sys_id",
+        "element_id",
+        "element",
+        "value",
+        "sys_created_on",
+        "sys_created_by",
+        "name",  # 'name' is the table of the parent ticket
+    )
+
+    def __init__(self, url: str, username: str, password: str, warm_up: bool = False):
         """Initializes the ServiceNowClient for standard API interactions.
 
-        The client sets up a requests session with HTTP Basic Authentication and
-        default headers for JSON content type and acceptance.
+        The client sets up two pooled requests sessions, one for reads and one for
+        writes, each with HTTP Basic Authentication and default headers for JSON
+        content type and acceptance.
 
         Args:
             url (str): The base URL of the ServiceNow instance (e.g., "https://instance.service-now.com").
                        The trailing slash will be removed if present.
             username (str): ServiceNow username for API authentication.
             password (str): ServiceNow password for API authentication.
+            warm_up (bool, optional): If True, `start_warm_up` is called, so the connection
+                setup overlaps with the caller's own startup work. This sends requests to the
+                instance; callers that may not need the client should call `start_warm_up`
+                once they know they do. Defaults to False.
 
         Raises:
             ValueError: If 'url', 'username', or 'password' are empty or not provided.
@@ -35,17 +301,112 @@ class ServiceNowClient:
         self.username = username
         self.url = url.rstrip("/")
         self.api_path = "/api/now"  # Standard ServiceNow API path
+        self._api_base = f"{self.url}{self.api_path}/"
+
+        # Reads and writes get separate pooled sessions (a bulkhead), so a burst of lookups can
+        # never take every connection away from ticket creation. Both are shared by all threads.
+        self._read_session = self._build_session(username, password)
+        self.session = self._build_session(username, password)  # Writes (POST, PUT, PATCH, DELETE)
+        self._write_slots = threading.Semaphore(MAX_CONCURRENT_WRITES)
+
+        self._breaker = CircuitBreaker()
+        self._record_cache = TTLCache(maxsize=RECORD_CACHE_MAXSIZE, ttl=RECORD_CACHE_TTL)
+        self._etag_cache = TTLCache(maxsize=ETAG_CACHE_MAXSIZE, ttl=ETAG_CACHE_TTL)
+
+        logging.info(f"ServiceNowClient initialized for instance: {self.url}")
 
-        self.session = requests.Session()
-        self.session.auth = HTTPBasicAuth(username, password)
-        self.session.headers.update(
+        if warm_up:
+            self.start_warm_up()
+
+    def start_warm_up(self) -> None:
+        """Runs `warm` in a background thread, so the connection setup overlaps with the caller's own work."""
+        threading.Thread(target=self.warm, name="servicenow-warm-up", daemon=True).start()
+
+    def warm(self) -> None:
+        """Opens a pooled connection on each session with a cheap HEAD request.
+
+        The TCP and TLS handshakes are then already done when the first real request
+        is sent. Failures are only logged at debug level; the real request reports them.
+        The requests go through the circuit breaker like any other: nothing is sent while
+        it is open, and connection failures count against it.
+        The MIME types database used by `add_attachment` is loaded here as well.
+        """
+        mimetypes.init()
+        warm_up_url = self._build_api_url("table/sys_user")
+        for session in (self.session, self._read_session):
+            if not self._breaker.allow_request():
+                return
+            try:
+                response = session.head(warm_up_url, params={"sysparm_limit": 1}, timeout=10)
+            except requests.exceptions.RequestException as e:
+                self._breaker.record_failure()
+                logging.debug(f"Connection warm-up to {self.url} failed: {e}")
+                continue
+            # Same rule as _execute_http_request: only throttling and server errors count against the instance
+            if response.status_code == 429 or response.status_code >= 500:
+                self._breaker.record_failure()
+            else:
+                self._breaker.record_success()
+
+    def _build_session(self, username: str, password: str) -> requests.Session:
+        """Creates a pooled session with authentication, retries and the default JSON headers.
+
+        Args:
+            username (str): ServiceNow username for API authentication.
+            password (str): ServiceNow password for API authentication.
+
+        Returns:
+            requests.Session: The configured session.
+        """
+        session = requests.Session()
+        session.auth = HTTPBasicAuth(username, password)
+        # requests re-reads proxy and CA bundle settings from the environment on every call
+        # while trust_env is on; resolve them once for the instance and skip that per-call work.
+        session.proxies.update(requests.utils.get_environ_proxies(self.url))
+        ca_bundle = os.environ.get("REQUESTS_CA_BUNDLE") or os.environ.get("CURL_CA_BUNDLE")
+        if ca_bundle:
+            session.verify = ca_bundle
+        session.trust_env = False
+        # Transient failures are retried below raise_for_status on the same pooled connection.
+        # POST is left out: retrying it after a lost response could create a duplicate ticket.
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            backoff_max=30,
+            backoff_jitter=0.5,  # Spreads out the retries of concurrent workers hitting the same throttling
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=RETRY_METHODS,
+            respect_retry_after_header=True,
+            raise_on_status=False,  # Hand the last response to raise_for_status so its body gets logged
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(
             {
                 "Content-Type": "application/json",
                 "Accept": "application/json",
+                # gzip/deflate, plus br and zstd when their decoders are installed
+                "Accept-Encoding": ACCEPT_ENCODING,
             }
         )
+        return session
 
-        logging.info(f"ServiceNowClient initialized for instance: {self.url}")
+    def _invalidate_table(self, table_name: str) -> None:
+        """Evicts all cached records of a table, e.g. after a record in it was created or updated."""
+        self._record_cache.evict(lambda key: key[0] == table_name)
+
+    def invalidate_record(self, table_name: str, sys_id: str) -> None:
+        """Evicts the cached lookups of a single record and of its journal entries.
+
+        Args:
+            table_name (str): The table the record belongs to (e.g., "incident").
+            sys_id (str): The sys_id of the record that changed.
+        """
+        self._record_cache.evict(
+            lambda key: (key[0] == table_name and key[1] == ("sys_id", sys_id))
+            or (key[0] == "sys_journal_field" and key[1] == ("element_id", sys_id))
+        )
 
     def _build_api_url(self, endpoint_segment: str) -> str:
         """Constructs the full URL for standard '/api/now' ServiceNow API endpoints.
@@ -58,7 +419,7 @@ class ServiceNowClient:
         Returns:
             str: The fully constructed API URL.
         """
-        return f"{self.url}{self.api_path}/{endpoint_segment.lstrip('/')}"
+        return _join_url(self._api_base, endpoint_segment)
 
     def _execute_http_request(
         self,
@@ -69,6 +430,9 @@ class ServiceNowClient:
         data=None,
         files=None,
         headers: dict = None,
+        timeout: float = REQUEST_TIMEOUT,
+        revalidate: bool = False,
+        raise_unsent: bool = False,
     ) -> dict | None:
         """Executes an HTTP request and handles common responses and errors.
 
@@ -91,55 +455,114 @@ class ServiceNowClient:
             headers (Optional[Dict[str, str]], optional): Dictionary of HTTP Headers to
                 send with the request, potentially overriding session defaults.
                 Defaults to None.
+            timeout (float, optional): Seconds to wait for the response. Defaults to REQUEST_TIMEOUT.
+            revalidate (bool, optional): For a GET, keep a response with an ETag of up to
+                ETAG_CACHE_MAX_BYTES, and revalidate the next identical GET with If-None-Match.
+                Meant for single records that are not cached elsewhere. Defaults to False.
+            raise_unsent (bool, optional): Raise `_RequestNotSent` instead of returning None
+                if the request provably never reached the instance (the circuit is open, or
+                the connection could not be established). Any other failure may have happened
+                after the instance acted on the request. Defaults to False.
 
         Returns:
            self (Optional[Dict[str, Any]], optional): The JSON response parsed into a Python dictionary.
             For 204 (No Content) or other successful responses with no body,
-            a dictionary with a "status" and "message" key is returned.
+            a read-only mapping with a "status" and "message" key is returned.
+            For a GET answered with 304 (Not Modified), the body of the earlier response
+            carrying the matching ETag is returned.
             Returns None if a request exception (HTTPError, ConnectionError, Timeout, etc.)
             occurs and is handled. Detailed error information is logged.
         """
+        if not self._breaker.allow_request():
+            logging.error(f"ServiceNow circuit is open after repeated failures. Skipping {method} {request_url}.")
+            if raise_unsent:
+                raise _RequestNotSent()
+            return None
+
+        if payload is not None and data is None:
+            # Serialized here rather than via `json=`; the session already sends the JSON Content-Type
+            data = fastjson.dumps(payload)
+        is_read = method in READ_METHODS
+
+        # GETs are revalidated with If-None-Match when an earlier response carried an ETag
+        etag_key = validated = None
+        if revalidate and method == "GET":
+            etag_key = _request_cache_key(request_url, params)
+            validated = self._etag_cache.get(etag_key)
+            if validated is not None:
+                headers = {**(headers or {}), "If-None-Match": validated[0]}
+
         try:
-            response = self.session.request(
-                method=method,
-                url=request_url,
-                params=params,
-                json=payload,
-                data=data,
-                headers=headers,
-                files=files,
-                timeout=30,
-            )
+            # Writes are capped at MAX_CONCURRENT_WRITES at a time; reads are not throttled
+            with contextlib.nullcontext() if is_read else self._write_slots:
+                response = (self._read_session if is_read else self.session).request(
+                    method=method,
+                    url=request_url,
+                    params=params,
+                    data=data,
+                    headers=headers,
+                    files=files,
+                    timeout=timeout,
+                )
             response.raise_for_status()
-            if response.status_code == 204:
-                return {
-                    "status": "success",
-                    "message": "Operation successful with no content returned.",
-                }
-            if not response.content:
-                return {
-                    "status": "success",
-                    "message": f"Operation successful with status {response.status_code} and no content.",
-                }
-            return response.json()
+            self._breaker.record_success()
+            if response.status_code == 304 and validated is not None:
+                logging.debug(f"Not modified since the last request: {request_url}")
+                return fastjson.loads(validated[1])  # Parsed again, so every caller gets its own copy
+            response_data = self._parse_response(response)
+            etag = response.headers.get("ETag") if etag_key else None
+            if etag and isinstance(response_data, dict) and len(response.content) <= ETAG_CACHE_MAX_BYTES:
+                self._etag_cache.set(etag_key, (etag, response.content))  # Not for the shared no-content results
+            return response_data
         except requests.exceptions.HTTPError as errh:
+            # Client errors (4xx) show the instance is up; only throttling and server errors count against it
+            if errh.response is not None and (errh.response.status_code == 429 or errh.response.status_code >= 500):
+                self._breaker.record_failure()
+            else:
+                self._breaker.record_success()
             logging.error(f"HTTP Error: {errh}")
             if errh.response is not None:
-                logging.error(f"Response Content: {errh.response.content}")
+                raw_body = errh.response.content  # Read once; .text would guess the encoding with chardet
                 try:
-                    error_details = errh.response.json()
+                    error_details = fastjson.loads(raw_body)
                     logging.error(f"Error Details: {error_details}")
-                except json.JSONDecodeError:
-                    logging.error(f"Error Response (non-JSON): {errh.response.text}")
+                except fastjson.JSONDecodeError:
+                    error_text = raw_body[:ERROR_BODY_LOG_LIMIT].decode("utf-8", "replace")
+                    truncated = f" ... ({len(raw_body)} bytes)" if len(raw_body) > ERROR_BODY_LOG_LIMIT else ""
+                    logging.error(f"Error Response (non-JSON): {error_text}{truncated}")
         except requests.exceptions.ConnectionError as errc:
+            self._breaker.record_failure()
             logging.error(f"Connection Error: {errc}")
+            if raise_unsent and _never_sent(errc):
+                raise _RequestNotSent() from errc
         except requests.exceptions.Timeout as errt:
+            self._breaker.record_failure()
             logging.error(f"Timeout Error: {errt}")
         except requests.exceptions.RequestException as err:
+            self._breaker.record_failure()
             logging.error(f"Request Exception: {err}")
+        except fastjson.JSONDecodeError as errj:
+            logging.error(f"Invalid JSON in response from {request_url}: {errj}")
 
         return None
 
+    def _parse_response(self, response: requests.Response) -> Mapping:
+        """Parses the body of a successful response.
+
+        Args:
+            response (requests.Response): A response whose status has already been checked.
+
+        Returns:
+            self (Mapping[str, Any]): The JSON response parsed into a Python dictionary.
+            For 204 (No Content) or other successful responses with no body,
+            a shared read-only mapping with a "status" and "message" key is returned.
+        """
+        if response.status_code == 204:
+            return _SUCCESS_NO_CONTENT
+        if not response.content:
+            return _success_without_content(response.status_code)
+        return fastjson.loads(response.content)
+
     def _make_request(
         self,
         method: str,
@@ -148,6 +571,8 @@ class ServiceNowClient:
         payload: dict = None,
         data=None,
         files=None,
+        timeout: float = REQUEST_TIMEOUT,
+        revalidate: bool = False,
     ) -> dict | None:
         """Makes an HTTP request to a standard ServiceNow API endpoint (under /api/now).
 
@@ -166,13 +591,17 @@ class ServiceNowClient:
                 Defaults to None.
             files (Optional[Dict[str, Any]], optional): Files for multipart upload.
                 Defaults to None.
+            timeout (float, optional): Seconds to wait for the response. Defaults to REQUEST_TIMEOUT.
+            revalidate (bool, optional): See `_execute_http_request`. Defaults to False.
 
         Returns:
             self (Optional[Dict[str, Any]], optional): The JSON response parsed into a Python dictionary,
             a success message dictionary, or None if an error occurred.
         """
         api_url = self._build_api_url(endpoint_segment)
-        return self._execute_http_request(method, api_url, params, payload, data, files)
+        return self._execute_http_request(
+            method, api_url, params, payload, data, files, timeout=timeout, revalidate=revalidate
+        )
 
     def _get_record(
         self,
@@ -181,12 +610,16 @@ class ServiceNowClient:
         query: str = None,
         fields: list[str] = None,
         limit: int = None,
+        offset: int = None,
+        revalidate: bool = False,
     ) -> dict | list | None:
         """Performs a GET request to the ServiceNow Table API to retrieve records.
 
         Fetches one or more records from a specified table. Records can be targeted
         by their unique `sys_id` or filtered using an encoded `query` string.
         This method interacts directly with the `/api/now/table/{table_name}` endpoint.
+        Reference fields are returned as plain sys_ids, without the inlined link objects.
+        Queries skip the total row count and the pagination links, which are never used.
 
         Args:
             table_name (str): The name of the ServiceNow table to query (e.g., "incident").
@@ -199,15 +632,21 @@ class ServiceNowClient:
                 in the response (maps to 'sysparm_fields'). If None, all fields
                 are returned by default by ServiceNow. Defaults to None.
             limit (Optional[int], optional): The maximum number of records to return
-                (maps to 'sysparm_limit'). If None, ServiceNow's instance default
-                is used. Defaults to None.
+                (maps to 'sysparm_limit'). If None, queries return up to
+                DEFAULT_QUERY_LIMIT records. Defaults to None.
+            offset (Optional[int], optional): The index of the first record to return
+                (maps to 'sysparm_offset'), used for paging through query results.
+                Defaults to None.
+            revalidate (bool, optional): For a lookup by 'sys_id', keep the response and
+                revalidate the next identical lookup with its ETag. Only for records that
+                are not cached otherwise. Defaults to False.
 
         Returns:
             self (Union[Dict[str, Any], List[Dict[str, Any]], None]):
             - If fetching by 'sys_id' and a single record is found, returns a
               dictionary representing that record (extracted from "result" if present,
               or the direct response if "result" is not the top-level key).
-            - If fetching by 'query', returns a list of dictionaries, where each
+            - If fetching by 'query', always returns a list of dictionaries, where each
               dictionary represents a found record (extracted from "result").
               Returns an empty list if the query is valid but yields no matches.
             - Returns None if an API error occurs (e.g., connection error,
@@ -222,12 +661,16 @@ class ServiceNowClient:
             raise ValueError("Table name must be provided.")
 
         endpoint_segment = f"table/{table_name}"
-        params_for_request = {}
+        params_for_request = {"sysparm_exclude_reference_link": "true"}
 
         if sys_id:
             endpoint_segment += f"/{sys_id}"
         elif query:
             params_for_request["sysparm_query"] = query
+            params_for_request["sysparm_no_count"] = "true"
+            params_for_request["sysparm_suppress_pagination_header"] = "true"
+            if limit is None:
+                limit = DEFAULT_QUERY_LIMIT
         else:
             logging.error("Neither sys_id nor query provided for _get_record.")
             raise ValueError("Either sys_id or query must be provided to _get_record.")
@@ -236,9 +679,11 @@ class ServiceNowClient:
             params_for_request["sysparm_fields"] = ",".join(fields)
         if limit is not None:
             params_for_request["sysparm_limit"] = limit
+        if offset:
+            params_for_request["sysparm_offset"] = offset
 
         response_data = self._make_request(
-            "GET", endpoint_segment, params=params_for_request
+            "GET", endpoint_segment, params=params_for_request, revalidate=revalidate and bool(sys_id)
         )
 
         if response_data:
@@ -247,22 +692,180 @@ class ServiceNowClient:
                     f"Direct record data received for sys_id '{sys_id}' from '{table_name}'."
                 )
                 return response_data
-            elif "result" in response_data:  # Queries
+            elif "result" in response_data:
+                result = response_data["result"]
                 logging.debug(
-                    f"'result' found in response from '{table_name}'. Type: {type(response_data['result'])}"
+                    f"'result' found in response from '{table_name}'. Type: {type(result)}"
                 )
-                return response_data["result"]
+                if sys_id or isinstance(result, list):
+                    return result
+                # Queries always return a list, so callers never need to check the type
+                logging.warning(
+                    f"Expected a list of records from '{endpoint_segment}', received {type(result)}."
+                )
+                return [result] if isinstance(result, dict) else []
             else:
                 logging.warning(
                     f"Response received for _get_record from '{endpoint_segment}' but structure is unexpected: {response_data}"
                 )
-                return response_data
+                return response_data if sys_id else []
 
         logging.debug(
             f"No data returned or error occurred in _get_record for '{endpoint_segment}' with params {params_for_request}"
         )
         return None
 
+    def _iter_records(
+        self,
+        table_name: str,
+        query: str,
+        fields: list[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        offset: int = 0,
+    ) -> Iterator[dict]:
+        """Lazily yields the records matching an encoded query, one page at a time.
+
+        The Table API has no line-delimited streaming format, so the result set is
+        paged with 'sysparm_offset' instead. Only one page is held in memory, and a
+        caller that stops iterating early saves the remaining round-trips.
+
+        Args:
+            table_name (str): The name of the ServiceNow table to query (e.g., "incident").
+            query (str): An encoded ServiceNow query string (e.g., "active=true^priority=1").
+            fields (Optional[List[str]], optional): A list of field names to include
+                in each record. Defaults to None (all fields).
+            page_size (int, optional): The number of records requested per round-trip.
+                Defaults to DEFAULT_PAGE_SIZE.
+            offset (int, optional): The index of the first record to yield, e.g. to continue
+                after records that were already retrieved. Defaults to 0.
+
+        Yields:
+            Dict[str, Any]: The next matching record. Iteration stops at the last page
+            or at the first page that could not be retrieved.
+        """
+        while True:
+            page = self._get_record(
+                table_name=table_name, query=query, fields=fields, limit=page_size, offset=offset
+            )
+            if not page:
+                return
+            yield from page
+            if len(page) < page_size:
+                return
+            offset += page_size
+
+    def _get_stats(self, table_name: str, query: str, aggregates: dict) -> dict | None:
+        """Aggregates the records matching an encoded query on the instance, using the Aggregate (stats) API.
+
+        Args:
+            table_name (str): The name of the ServiceNow table to query (e.g., "incident").
+            query (str): An encoded ServiceNow query string (e.g., "active=true^priority=1").
+            aggregates (Dict[str, str]): The aggregate parameters, e.g.
+                {"sysparm_count": "true"} or {"sysparm_max_fields": "sys_created_on"}.
+
+        Returns:
+            self (Optional[Dict[str, Any]]): The 'stats' object of the response
+            (e.g., {"count": "3"}), or None if it could not be retrieved.
+        """
+        response_data = self._make_request(
+            "GET", f"stats/{table_name}", params={**aggregates, "sysparm_query": query}
+        )
+        try:
+            return response_data["result"]["stats"]
+        except (KeyError, TypeError):
+            logging.warning(f"Unexpected response from the stats API for '{table_name}': {response_data}")
+            return None
+
+    def _count_records(self, table_name: str, query: str) -> int | None:
+        """Counts the records matching an encoded query, without retrieving them.
+
+        Args:
+            table_name (str): The name of the ServiceNow table to query (e.g., "incident").
+            query (str): An encoded ServiceNow query string (e.g., "active=true^priority=1").
+
+        Returns:
+            self (Optional[int]): The number of matching records, or None if the count
+            could not be retrieved.
+        """
+        stats = self._get_stats(table_name, query, {"sysparm_count": "true"})
+        try:
+            return int(stats["count"])
+        except (KeyError, TypeError, ValueError):
+            logging.warning(f"Could not read the record count of '{table_name}' from: {stats}")
+            return None
+
+    def _paginated_get(
+        self,
+        table_name: str,
+        query: str,
+        fields: list[str] = None,
+        total_limit: int = None,
+        page_size: int = PARALLEL_PAGE_SIZE,
+        max_workers: int = PAGINATION_MAX_WORKERS,
+    ) -> list[dict] | None:
+        """Retrieves all records matching an encoded query, fetching the pages concurrently.
+
+        The first page is fetched on its own. Only if it is full are the remaining
+        records counted, and the remaining pages then requested in parallel with
+        distinct 'sysparm_offset' windows, so a large result set costs about two
+        round-trips of wall time instead of one per page.
+
+        Args:
+            table_name (str): The name of the ServiceNow table to query (e.g., "incident").
+            query (str): An encoded ServiceNow query string; it should include an ORDERBY,
+                so the pages do not overlap.
+            fields (Optional[List[str]], optional): A list of field names to include
+                in each record. Defaults to None (all fields).
+            total_limit (Optional[int], optional): The maximum number of records to return.
+                Defaults to None (all matching records).
+            page_size (int, optional): The number of records requested per round-trip.
+                Defaults to PARALLEL_PAGE_SIZE.
+            max_workers (int, optional): The number of pages fetched at the same time.
+                Defaults to PAGINATION_MAX_WORKERS.
+
+        Returns:
+            self (Optional[List[Dict[str, Any]]]): The matching records in query order,
+            or None if any page could not be retrieved.
+        """
+        first_limit = page_size if total_limit is None else min(page_size, total_limit)
+        records = self._get_record(table_name=table_name, query=query, fields=fields, limit=first_limit)
+        if records is None or len(records) < page_size or len(records) == total_limit:
+            return records
+
+        total = self._count_records(table_name, query)
+        if total is None:
+            # Without a total the pages can't be planned up front; read the rest one by one after the first page
+            while total_limit is None or len(records) < total_limit:
+                limit = page_size if total_limit is None else min(page_size, total_limit - len(records))
+                page = self._get_record(
+                    table_name=table_name, query=query, fields=fields, limit=limit, offset=len(records)
+                )
+                if page is None:
+                    return None
+                records.extend(page)
+                if len(page) < limit:
+                    break
+            return records
+        if total_limit is not None:
+            total = min(total, total_limit)
+
+        def fetch_page(offset: int) -> list[dict] | None:
+            return self._get_record(
+                table_name=table_name,
+                query=query,
+                fields=fields,
+                limit=min(page_size, total - offset),
+                offset=offset,
+            )
+
+        offsets = range(page_size, total, page_size)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(offsets) or 1)) as pool:
+            for page in pool.map(fetch_page, offsets):
+                if page is None:
+                    return None
+                records.extend(page)
+        return records
+
     def _find_record(
         self,
         table_name: str,
@@ -289,7 +892,9 @@ class ServiceNowClient:
 
         Returns:
             self (Optional[Dict[str, Any]], optional): A dictionary representing the single record found,
-            or None if no record is found or an API error occurred.
+            or None if no record is found or an API error occurred. Records found are cached for
+            RECORD_CACHE_TTL seconds, numbers that matched nothing for NEGATIVE_CACHE_TTL seconds;
+            a write to the same table through this client evicts them.
 
         Raises:
             ValueError: If 'table_name' is empty, or if neither 'sys_id' nor 'number'
@@ -303,6 +908,19 @@ class ServiceNowClient:
                 "Either sys_id or number must be provided to find a record."
             )
 
+        cache_key = (
+            table_name,
+            ("sys_id", sys_id) if sys_id else ("number", number),
+            tuple(sorted(fields)) if fields else None,
+        )
+        cached = self._record_cache.get(cache_key)
+        if cached is _MISS:
+            logging.debug(f"No record found in '{table_name}' (cached)")
+            return None
+        if cached is not None:
+            logging.debug(f"Record found in cache for '{table_name}'")
+            return copy.deepcopy(cached)
+
         if sys_id:
             logging.debug(f"Fetching record from '{table_name}' by sys_id: '{sys_id}'")
             record_data = self._get_record(
@@ -310,26 +928,61 @@ class ServiceNowClient:
             )
         else:
             logging.debug(f"Fetching record from '{table_name}' by number: '{number}'")
-            query = f"number={number}"
+            query = f"number={_escape_query_value(number)}"
             records_list = self._get_record(
                 table_name=table_name, query=query, fields=fields, limit=1
             )
-            if (
-                records_list and isinstance(records_list, list) and records_list
-            ):  # Check if list is not empty
+            if records_list:
                 record_data = records_list[0]
-            elif records_list and not isinstance(records_list, list):
-                logging.warning(
-                    f"Expected list from _get_record for number '{number}' in '{table_name}', received {type(records_list)}."
-                )
+            elif records_list == []:  # Matched nothing, as opposed to an API error (None)
+                self._record_cache.set(cache_key, _MISS, ttl=NEGATIVE_CACHE_TTL)
 
         if record_data:
             logging.debug(f"Record found in '{table_name}'")
+            self._record_cache.set(cache_key, copy.deepcopy(record_data))
         else:
             logging.debug(f"No record found in '{table_name}'")
 
         return record_data
 
+    def _get_records_by(
+        self,
+        table_name: str,
+        key_field: str,
+        values: list[str],
+        fields: list[str] = None,
+        chunk_size: int = IN_QUERY_CHUNK_SIZE,
+    ) -> dict[str, dict]:
+        """Retrieves the records whose `key_field` is one of `values`, with one 'IN' query per chunk.
+
+        Args:
+            table_name (str): The name of the ServiceNow table (e.g., "sc_req_item").
+            key_field (str): The field matched against `values` (e.g., "number", "sys_id", "name").
+            values (List[str]): The values to look up. Values must not contain commas,
+                the separator of an 'IN' list.
+            fields (Optional[List[str]], optional): A list of field names to retrieve;
+                `key_field` is always added. Defaults to None (all fields).
+            chunk_size (int, optional): The number of values per request, which keeps the URL
+                short enough for the instance. Defaults to IN_QUERY_CHUNK_SIZE.
+
+        Returns:
+            self (Dict[str, Dict[str, Any]]): The records found, keyed by their `key_field` value.
+            Values without a matching record (or whose chunk failed) are missing from the result.
+        """
+        if fields and key_field not in fields:
+            fields = [*fields, key_field]
+
+        records_by_key = {}
+        for chunk in itertools.batched(dict.fromkeys(values), chunk_size):
+            query = f"{key_field}IN{','.join(_escape_query_value(value) for value in chunk)}"
+            records = self._get_record(table_name=table_name, query=query, fields=fields)
+            if records is None:
+                logging.error(f"Failed to retrieve {len(chunk)} record(s) from '{table_name}' by {key_field}.")
+                continue
+            for record in records:
+                records_by_key.setdefault(record.get(key_field), record)
+        return records_by_key
+
     def get_catalog_task(
         self, number: str = None, sys_id: str = None, fields: list[str] = None
     ) -> dict | None:
@@ -344,8 +997,8 @@ class ServiceNowClient:
             sys_id (Optional[str], optional): The unique system ID of the catalog task.
                 Takes precedence over 'number'. Defaults to None.
             fields (Optional[List[str]], optional): A list of field names to be
-                returned for the catalog task. If None, all fields are returned.
-                Defaults to None.
+                returned for the catalog task. If None, all fields are returned; pass
+                DEFAULT_FIELDS["sc_task"] for the common ones only. Defaults to None.
 
         Returns:
             self (Optional[Dict[str, Any]], optional): A dictionary representing the catalog task record
@@ -389,46 +1042,32 @@ class ServiceNowClient:
             )
 
         table_name = "u_organization"
-        fields_to_fetch = {"sys_id", "name"}
-
-        if extra_fields:
-            fields_to_fetch.update(extra_fields)
-
-        fields_list = list(fields_to_fetch)
+        fields_list = _name_lookup_fields(tuple(extra_fields or ()))
 
         record_data = None
         if sys_id:
             logging.debug(
                 f"Fetching organization from '{table_name}' by sys_id: '{sys_id}'"
             )
+            # Organizations rarely change and are not in the record cache; revalidate with the ETag
             record_data = self._get_record(
-                table_name=table_name, sys_id=sys_id, fields=fields_list
+                table_name=table_name, sys_id=sys_id, fields=fields_list, revalidate=True
             )
         else:
             logging.debug(
                 f"Fetching organization from '{table_name}' by name: '{name}'"
             )
-            query = f"name={name}"
+            query = f"name={_escape_query_value(name)}"
             records_list = self._get_record(
                 table_name=table_name, query=query, fields=fields_list, limit=1
             )
-            if records_list and isinstance(records_list, list):
+            if records_list:
                 record_data = records_list[0]
-            elif records_list and not isinstance(records_list, list):
-                logging.warning(
-                    f"Expected list from _get_record for name '{name}' in '{table_name}', received {type(records_list)}. Data: {records_list}"
-                )
 
         if record_data:
-            team_info = {
-                key: record_data.get(key)
-                for key in fields_list
-                if record_data.get(key) is not None
-            }
-            team_info.setdefault("sys_id", record_data.get("sys_id"))
-            team_info.setdefault("name", record_data.get("name"))
-            logging.debug(f"Team found in '{table_name}': {team_info}")
-            return team_info
+            # 'sysparm_fields' already limits the record to the requested fields
+            logging.debug(f"Organization found in '{table_name}': {record_data}")
+            return record_data
         else:
             logging.debug(f"No organization found in '{table_name}'")
             return None
@@ -479,7 +1118,7 @@ class ServiceNowClient:
             (extracted from the 'result' field of the response), or None if creation failed
             or the API response was unexpected.
         """
-        endpoint_segment = f"table/incident"
+        endpoint_segment = self._INCIDENT_ENDPOINT
         payload = {
             "caller_id": self.username,
             "contact_type": "Interface",
@@ -502,6 +1141,7 @@ class ServiceNowClient:
         response_data = self._make_request(
             method="POST", endpoint_segment=endpoint_segment, payload=payload
         )
+        self._invalidate_table("incident")
 
         if (
             response_data
@@ -533,6 +1173,34 @@ class ServiceNowClient:
             )
             return None
 
+    def _requested_item_payload(
+        self,
+        assignment_group: str,
+        description: str,
+        short_description: str,
+        area: str = None,
+        business_service: str = None,
+        organization: str = None,
+        subcategory: str = None,
+        service_group: str = None,
+        category: str = None,
+    ) -> dict:
+        """Builds the body of a 'sc_req_item' create request; see `create_requested_item` for the arguments."""
+        return {
+            "caller_id": self.username,
+            "contact_type": "Interface",
+            "requested_for": self.username,
+            "u_kot_organization": organization,
+            "u_area": area,
+            "u_service_group": service_group,
+            "business_service": business_service,
+            "category": category,
+            "subcategory": subcategory,
+            "assignment_group": assignment_group,
+            "short_description": short_description,
+            "description": description,
+        }
+
     def create_requested_item(
         self,
         assignment_group: str,
@@ -573,27 +1241,25 @@ class ServiceNowClient:
             (extracted from the 'result' field of the response), or None if creation failed
             or the API response was unexpected.
         """
-        endpoint_segment = f"table/sc_req_item"
-        payload = {
-            "caller_id": self.username,
-            "contact_type": "Interface",
-            "requested_for": self.username,
-            "u_kot_organization": organization,
-            "u_area": area,
-            "u_service_group": service_group,
-            "business_service": business_service,
-            "category": category,
-            "subcategory": subcategory,
-            "assignment_group": assignment_group,
-            "short_description": short_description,
-            "description": description,
-        }
+        endpoint_segment = self._RITM_ENDPOINT
+        payload = self._requested_item_payload(
+            assignment_group=assignment_group,
+            description=description,
+            short_description=short_description,
+            area=area,
+            business_service=business_service,
+            organization=organization,
+            subcategory=subcategory,
+            service_group=service_group,
+            category=category,
+        )
         logging.info(f"Attempting to create ritm")
         logging.debug(f"Payload: {payload}")
 
         response_data = self._make_request(
             method="POST", endpoint_segment=endpoint_segment, payload=payload
         )
+        self._invalidate_table("sc_req_item")
 
         if (
             response_data
@@ -638,8 +1304,8 @@ class ServiceNowClient:
             sys_id (Optional[str], optional): The unique system ID of the incident.
                 Takes precedence over 'number'. Defaults to None.
             fields (Optional[List[str]], optional): A list of field names to be
-                returned for the incident. If None, all fields are returned.
-                Defaults to None.
+                returned for the incident. If None, all fields are returned; pass
+                DEFAULT_FIELDS["incident"] for the common ones only. Defaults to None.
 
         Returns:
             self (Optional[Dict[str, Any]], optional): A dictionary representing the incident record
@@ -664,8 +1330,8 @@ class ServiceNowClient:
             sys_id (Optional[str], optional): The unique system ID of the RITM.
                 Takes precedence over 'number'. Defaults to None.
             fields (Optional[List[str]], optional): A list of field names to be
-                returned for the RITM. If None, all fields are returned.
-                Defaults to None.
+                returned for the RITM. If None, all fields are returned; pass
+                DEFAULT_FIELDS["sc_req_item"] for the common ones only. Defaults to None.
 
         Returns:
             self (Optional[Dict[str, Any]], optional): A dictionary representing the RITM record
@@ -675,6 +1341,38 @@ class ServiceNowClient:
             table_name="sc_req_item", sys_id=sys_id, number=number, fields=fields
         )
 
+    def get_requested_items(
+        self,
+        numbers: list[str] = None,
+        sys_ids: list[str] = None,
+        fields: list[str] = None,
+        chunk_size: int = IN_QUERY_CHUNK_SIZE,
+    ) -> dict[str, dict]:
+        """Retrieves many Requested Item (RITM) records with one request per `chunk_size` items.
+
+        Args:
+            numbers (Optional[List[str]], optional): The RITM numbers to look up.
+                Used if 'sys_ids' is not provided. Defaults to None.
+            sys_ids (Optional[List[str]], optional): The sys_ids to look up. Takes precedence
+                over 'numbers'. Defaults to None.
+            fields (Optional[List[str]], optional): A list of field names to be returned
+                for each RITM. Defaults to None (all fields).
+            chunk_size (int, optional): The number of RITMs requested per round-trip.
+                Defaults to IN_QUERY_CHUNK_SIZE.
+
+        Returns:
+            self (Dict[str, Dict[str, Any]]): The RITMs found, keyed by sys_id if 'sys_ids'
+            was given, otherwise by number.
+
+        Raises:
+            ValueError: If neither 'numbers' nor 'sys_ids' is provided.
+        """
+        if sys_ids:
+            return self._get_records_by("sc_req_item", "sys_id", sys_ids, fields, chunk_size)
+        if numbers:
+            return self._get_records_by("sc_req_item", "number", numbers, fields, chunk_size)
+        raise ValueError("Either numbers or sys_ids must be provided to get requested items.")
+
     def get_service_request(
         self, number: str = None, sys_id: str = None, fields: list[str] = None
     ) -> dict | None:
@@ -690,8 +1388,8 @@ class ServiceNowClient:
             sys_id (Optional[str], optional): The unique system ID of the request.
                 Takes precedence over 'number'. Defaults to None.
             fields (Optional[List[str]], optional): A list of field names to be
-                returned for the request. If None, all fields are returned.
-                Defaults to None.
+                returned for the request. If None, all fields are returned; pass
+                DEFAULT_FIELDS["sc_request"] for the common ones only. Defaults to None.
 
         Returns:
             self (Optional[Dict[str, Any]], optional): A dictionary representing the request record
@@ -733,12 +1431,20 @@ class ServiceNowClient:
             )
 
         table_name = "sys_user_group"
-        fields_to_fetch = {"sys_id", "name"}
-
-        if extra_fields:
-            fields_to_fetch.update(extra_fields)
+        fields_list = _name_lookup_fields(tuple(extra_fields or ()))
 
-        fields_list = list(fields_to_fetch)
+        cache_key = (
+            table_name,
+            ("sys_id", sys_id) if sys_id else ("name", name),
+            fields_list,
+        )
+        cached = self._record_cache.get(cache_key)
+        if cached is _MISS:
+            logging.debug(f"No team found in '{table_name}' (cached)")
+            return None
+        if cached is not None:
+            logging.debug(f"Team found in cache for '{table_name}'")
+            return copy.deepcopy(cached)
 
         record_data = None
         if sys_id:
@@ -748,31 +1454,43 @@ class ServiceNowClient:
             )
         else:
             logging.debug(f"Fetching team from '{table_name}' by name: '{name}'")
-            query = f"name={name}"
+            query = f"name={_escape_query_value(name)}"
             records_list = self._get_record(
                 table_name=table_name, query=query, fields=fields_list, limit=1
             )
-            if records_list and isinstance(records_list, list):
+            if records_list:
                 record_data = records_list[0]
-            elif records_list and not isinstance(records_list, list):
-                logging.warning(
-                    f"Expected list from _get_record for name '{name}' in '{table_name}', received {type(records_list)}. Data: {records_list}"
-                )
+            elif records_list == []:  # Matched nothing, as opposed to an API error (None)
+                self._record_cache.set(cache_key, _MISS, ttl=NEGATIVE_CACHE_TTL)
 
         if record_data:
-            team_info = {
-                key: record_data.get(key)
-                for key in fields_list
-                if record_data.get(key) is not None
-            }
-            team_info.setdefault("sys_id", record_data.get("sys_id"))
-            team_info.setdefault("name", record_data.get("name"))
+            # 'sysparm_fields' already limits the record to the requested fields, sys_id and name included
+            team_info = {key: value for key, value in record_data.items() if value is not None}
             logging.debug(f"Team found in '{table_name}': {team_info}")
+            self._record_cache.set(cache_key, copy.deepcopy(team_info))
             return team_info
         else:
             logging.debug(f"No team found in '{table_name}'")
             return None
 
+    def get_teams(
+        self, names: list[str], extra_fields: list[str] = None, chunk_size: int = IN_QUERY_CHUNK_SIZE
+    ) -> dict[str, dict]:
+        """Retrieves many team (user group) records by name with one request per `chunk_size` names.
+
+        Args:
+            names (List[str]): The team names to look up.
+            extra_fields (Optional[List[str]], optional): A list of additional field names
+                to retrieve besides 'sys_id' and 'name'. Defaults to None.
+            chunk_size (int, optional): The number of names requested per round-trip.
+                Defaults to IN_QUERY_CHUNK_SIZE.
+
+        Returns:
+            self (Dict[str, Dict[str, Any]]): The teams found, keyed by name.
+        """
+        fields_list = _name_lookup_fields(tuple(extra_fields or ()))
+        return self._get_records_by("sys_user_group", "name", names, fields_list, chunk_size)
+
     def get_ticket_journal_entries(
         self, sys_id: str, order_by_desc: bool = True, limit: int = None
     ) -> list[dict] | None:
@@ -789,13 +1507,15 @@ class ServiceNowClient:
                 date in descending order (newest first). If False, orders in
                 ascending order (oldest first). Defaults to True.
             limit (Optional[int], optional): The maximum number of journal entries to return.
-                If None, ServiceNow's default limit applies. Defaults to None.
+                If None, all entries are returned. Long journals are fetched in pages of
+                PARALLEL_PAGE_SIZE, requested concurrently. Defaults to None.
 
         Returns:
             self (Optional[List[Dict[str, Any]]], optional): A list of dictionaries, where each dictionary
             represents a journal entry. Returns an empty list if no matching journal
             entries are found for the ticket. Returns None if an API error occurs during
-            the retrieval process.
+            the retrieval process. Results are cached for RECORD_CACHE_TTL seconds; updating
+            the ticket or attaching a file to it through this client evicts them.
 
         Raises:
             ValueError: If 'sys_id' is not provided or is empty.
@@ -803,51 +1523,34 @@ class ServiceNowClient:
         if not sys_id:
             raise ValueError("Ticket sys_id must be provided.")
 
-        query_parts = [f"element_id={sys_id}"]
-        query_parts.append(f"elementINcomments,work_notes")  # comments, work_notes
+        query_template = self._JOURNAL_QUERY_DESC if order_by_desc else self._JOURNAL_QUERY_ASC
+        final_query = query_template.format(sys_id=_escape_query_value(sys_id))
 
-        if order_by_desc:
-            query_parts.append("ORDERBYDESCsys_created_on")
-        else:
-            query_parts.append("ORDERBYsys_created_on")
-
-        final_query = "^".join(query_parts)
-
-        fields_to_fetch = [
-            "sys_id",
-            "element_id",
-            "element",
-            "value",
-            "sys_created_on",
-            "sys_created_by",
-            "name",  # 'name' is the table of the parent ticket
-        ]
+        cache_key = ("sys_journal_field", ("element_id", sys_id), (order_by_desc, limit))
+        cached = self._record_cache.get(cache_key)
+        if cached is not None:
+            logging.debug(f"Journal entries found in cache for ticket '{sys_id}'")
+            return copy.deepcopy(cached)
 
         logging.debug(
             f"Fetching journal entries for ticket sys_id '{sys_id}' using query: '{final_query}'"
         )
 
-        journal_entries_result = self._get_record(
+        journal_entries_result = self._paginated_get(
             table_name="sys_journal_field",
             query=final_query,
-            fields=fields_to_fetch,
-            limit=limit,
+            fields=self._JOURNAL_FIELDS,
+            total_limit=limit,
         )
 
-        # _get_record with a query returns a list of records or None if an error occurred.
+        # _paginated_get returns a list of records or None if an error occurred.
         # If no records are found by the query but the query itself was valid,
         if journal_entries_result is None:
             logging.error(f"Failed to retrieve journal entries for ticket '{sys_id}'.")
             return None
+        self._record_cache.set(cache_key, copy.deepcopy(journal_entries_result))
 
         # If journal_entries_result is an empty list, it means no entries matched.
-        # If it's not a list at all (shouldn't happen if _get_record is consistent for queries), log warning.
-        if not isinstance(journal_entries_result, list):
-            logging.warning(
-                f"Expected a list of journal entries from _get_record, but received type {type(journal_entries_result)}. Data: {journal_entries_result}"
-            )
-            return []
-
         if not journal_entries_result:  # Catches empty list
             logging.info(
                 f"No journal entries found for ticket '{sys_id}' matching the criteria."
@@ -855,6 +1558,51 @@ class ServiceNowClient:
 
         return journal_entries_result
 
+    def get_journal_entry_count(self, sys_id: str) -> int | None:
+        """Counts the journal entries (comments and work notes) of a ticket.
+
+        The count is computed on the instance, so no journal entries are transferred.
+
+        Args:
+            sys_id (str): The sys_id of the parent ticket (e.g., Incident, RITM).
+
+        Returns:
+            self (Optional[int]): The number of journal entries, or None if an error occurs.
+
+        Raises:
+            ValueError: If 'sys_id' is not provided or is empty.
+        """
+        if not sys_id:
+            raise ValueError("Ticket sys_id must be provided.")
+
+        query = self._JOURNAL_QUERY.format(sys_id=_escape_query_value(sys_id))
+        return self._count_records("sys_journal_field", query)
+
+    def get_latest_journal_timestamp(self, sys_id: str) -> str | None:
+        """Returns when the newest journal entry (comment or work note) of a ticket was created.
+
+        Useful to detect new activity on a ticket without retrieving its journal.
+
+        Args:
+            sys_id (str): The sys_id of the parent ticket (e.g., Incident, RITM).
+
+        Returns:
+            self (Optional[str]): The 'sys_created_on' value of the newest entry
+            (e.g., "2024-01-31 12:00:00"), or None if the ticket has no journal
+            entries or an error occurs.
+
+        Raises:
+            ValueError: If 'sys_id' is not provided or is empty.
+        """
+        if not sys_id:
+            raise ValueError("Ticket sys_id must be provided.")
+
+        query = self._JOURNAL_QUERY.format(sys_id=_escape_query_value(sys_id))
+        stats = self._get_stats("sys_journal_field", query, {"sysparm_max_fields": "sys_created_on"})
+        if stats is None:
+            return None
+        return (stats.get("max") or {}).get("sys_created_on") or None
+
     def update_ticket(self, table_name: str, sys_id: str, payload: dict) -> dict | None:
         """Updates an existing record (e.g., a ticket) in the specified ServiceNow table.
 
@@ -889,6 +1637,8 @@ class ServiceNowClient:
 
         endpoint_segment = f"table/{table_name}/{sys_id}"
         response_data = self._make_request("PUT", endpoint_segment, payload=payload)
+        self._invalidate_table(table_name)
+        self.invalidate_record(table_name, sys_id)
 
         if response_data and "result" in response_data:
             updated_record = response_data["result"]
@@ -946,7 +1696,7 @@ class ServiceNowClient:
             f"Attempting to attach file '{attachment_name}' from path '{file_path}' to record '{sys_id}' in table '{table_name}'."
         )
 
-        attachment_api_url = f"{self.url}{self.api_path}/attachment/file"
+        attachment_api_url = self._build_api_url("attachment/file")
 
         params = {
             "table_name": table_name,
@@ -954,32 +1704,25 @@ class ServiceNowClient:
             "file_name": attachment_name,
         }
 
-        # Determine the content type of the file
-        content_type, _ = mimetypes.guess_type(file_path)
-        if content_type is None:
-            content_type = (
-                "application/octet-stream"  # Default if type can't be guessed
-            )
-
-        # Prepare headers for this specific request
-        # These will override session headers
-        request_headers = self.session.headers.copy()  # Start with session headers
-        request_headers["Content-Type"] = content_type
-        request_headers["Accept"] = "application/json"
+        # Only the headers specific to this request; requests merges them over the session headers
+        request_headers = {
+            "Content-Type": _guess_content_type(os.path.splitext(file_path)[1].lower())
+        }
 
         response_data = None
         try:
             with open(file_path, "rb") as f_binary:
-                file_content = f_binary.read()
-
-            # Send raw file bytes in the 'data' parameter
-            response_data = self._execute_http_request(
-                method="POST",
-                request_url=attachment_api_url,
-                params=params,
-                headers=request_headers,  # Pass the specific headers for this request
-                data=file_content,  # Pass raw file content
-            )
+                # The open file is streamed in chunks rather than read into memory first
+                request_headers["Content-Length"] = str(os.fstat(f_binary.fileno()).st_size)
+                response_data = self._execute_http_request(
+                    method="POST",
+                    request_url=attachment_api_url,
+                    params=params,
+                    headers=request_headers,  # Pass the specific headers for this request
+                    data=f_binary,  # Raw file bytes, read by requests as they are sent
+                )
+            if response_data:
+                self.invalidate_record(table_name, sys_id)
         except IOError as e:
             logging.error(f"IOError reading file for attachment {file_path}: {e}")
         except Exception as e:
@@ -1006,11 +1749,182 @@ class ServiceNowClient:
                 f"Failed to attach file '{attachment_name}' to {sys_id} in {table_name}."
             )
             return None
-        
+
+    def get_many(self, specs: list[tuple[str, dict]]) -> list:
+        """Runs several independent lookups concurrently over the pooled read session.
+
+        Args:
+            specs (List[Tuple[str, Dict[str, Any]]]): The lookups to perform, as
+                (record type, keyword arguments) pairs, e.g.
+                `[("incident", {"number": "INC0010001"}), ("team", {"name": "Service Desk"})]`.
+                The record type is one of LOOKUP_TYPES and the keyword arguments are
+                passed to the matching `get_*` method.
+
+        Returns:
+            self (List[Optional[Dict[str, Any]]]): The results in the order of `specs`.
+            A lookup that found nothing or failed yields None; failures are logged.
+
+        Raises:
+            ValueError: If a spec names an unknown record type.
+        """
+        unknown = sorted({kind for kind, _ in specs} - LOOKUP_TYPES)
+        if unknown:
+            raise ValueError(f"Unknown record type(s) for get_many: {unknown}. Allowed: {sorted(LOOKUP_TYPES)}")
+        if not specs:
+            return []
+
+        def lookup(spec: tuple[str, dict]) -> dict | None:
+            kind, kwargs = spec
+            try:
+                return getattr(self, f"get_{kind}")(**kwargs)
+            except Exception as e:
+                logging.error(f"Lookup of {kind} {kwargs} failed: {e}")
+                return None
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(GET_MANY_MAX_WORKERS, len(specs))) as pool:
+            return list(pool.map(lookup, specs))
+
+    def _execute_batch(
+        self, sub_requests: list[tuple[str, str, dict | None]]
+    ) -> list[tuple[int, dict | None] | None] | None:
+        """Sends several REST calls to the Batch API, BATCH_MAX_REQUESTS per round-trip.
+
+        Each round-trip waits REQUEST_TIMEOUT plus BATCH_TIMEOUT_PER_REQUEST seconds per call
+        for the response, as the instance runs the calls one after the other.
+
+        Args:
+            sub_requests (List[Tuple[str, str, Optional[Dict[str, Any]]]]): The calls to make, as
+                (method, instance-relative URL, JSON body or None) tuples, e.g.
+                `("GET", "/api/now/table/incident/<sys_id>", None)`.
+
+        Returns:
+            self (Optional[List[Optional[Tuple[int, Optional[Dict[str, Any]]]]]]): One entry per
+            sub-request, in order: its (status code, parsed JSON body), or None if its round-trip
+            failed or ServiceNow did not service that sub-request. A round-trip that failed after
+            it was sent (e.g. a read timeout) may still have been carried out by the instance.
+            None instead of the list if no round-trip was ever sent (see `_RequestNotSent`),
+            so callers know the calls can safely be sent again.
+        """
+        results = [None] * len(sub_requests)
+        any_sent = False
+        for first in range(0, len(sub_requests), BATCH_MAX_REQUESTS):
+            rest_requests = []
+            for index, (method, url, body) in enumerate(sub_requests[first:first + BATCH_MAX_REQUESTS], start=first):
+                rest_request = {"id": str(index), "method": method, "url": url, "headers": BATCH_HEADERS}
+                if body is not None:
+                    rest_request["body"] = base64.b64encode(fastjson.dumps(body)).decode("ascii")
+                rest_requests.append(rest_request)
+
+            try:
+                response_data = self._execute_http_request(
+                    "POST",
+                    self._build_api_url("v1/batch"),
+                    payload={"batch_request_id": uuid.uuid4().hex, "rest_requests": rest_requests},
+                    timeout=REQUEST_TIMEOUT + BATCH_TIMEOUT_PER_REQUEST * len(rest_requests),
+                    raise_unsent=True,
+                )
+            except _RequestNotSent:
+                logging.error(f"Batch request with {len(rest_requests)} call(s) was not sent.")
+                continue
+            any_sent = True
+            if not response_data:
+                logging.error(f"Batch request with {len(rest_requests)} call(s) failed; their outcome is unknown.")
+                continue
+
+            for serviced in response_data.get("serviced_requests", []):
+                encoded_body = serviced.get("body")
+                try:
+                    body = fastjson.loads(base64.b64decode(encoded_body)) if encoded_body else None
+                except (ValueError, fastjson.JSONDecodeError) as e:
+                    logging.warning(f"Could not decode the body of batch call {serviced.get('id')}: {e}")
+                    body = None
+                results[int(serviced["id"])] = (serviced.get("status_code"), body)
+
+            unserviced = response_data.get("unserviced_requests") or []
+            if unserviced:
+                logging.warning(f"ServiceNow did not service batch call(s): {unserviced}")
+
+        return results if any_sent else None
+
+    def batch_get(self, reads: list[tuple[str, str]], fields: list[str] = None) -> list[dict | None]:
+        """Retrieves several records by sys_id in as few round-trips as possible, using the Batch API.
+
+        Args:
+            reads (List[Tuple[str, str]]): The records to fetch, as (table name, sys_id) pairs.
+            fields (Optional[List[str]], optional): A list of field names to return for
+                every record. Defaults to None (all fields).
+
+        Returns:
+            self (List[Optional[Dict[str, Any]]]): The records in the order of `reads`;
+            None for a record that was not found or could not be retrieved.
+        """
+        params = {"sysparm_exclude_reference_link": "true"}
+        if fields:
+            params["sysparm_fields"] = ",".join(fields)
+        params = f"?{urlencode(params)}"
+        results = self._execute_batch(
+            [("GET", f"{self.api_path}/table/{table_name}/{sys_id}{params}", None) for table_name, sys_id in reads]
+        )
+        return [_batch_result(result) for result in results or [None] * len(reads)]
+
+    def get_incidents_bulk(self, numbers: list[str], fields: list[str] = None) -> list[dict | None]:
+        """Retrieves several incidents by number in as few round-trips as possible, using the Batch API.
+
+        Args:
+            numbers (List[str]): The incident numbers (e.g., "INC0010001").
+            fields (Optional[List[str]], optional): A list of field names to return for
+                every incident. Defaults to None (all fields).
+
+        Returns:
+            self (List[Optional[Dict[str, Any]]]): The incidents in the order of `numbers`;
+            None for an incident that was not found or could not be retrieved.
+        """
+        sub_requests = []
+        for number in numbers:
+            params = {
+                "sysparm_query": f"number={_escape_query_value(number)}",
+                "sysparm_limit": 1,
+                "sysparm_no_count": "true",
+                "sysparm_exclude_reference_link": "true",
+            }
+            if fields:
+                params["sysparm_fields"] = ",".join(fields)
+            sub_requests.append(("GET", f"{self.api_path}/{self._INCIDENT_ENDPOINT}?{urlencode(params)}", None))
+
+        results = []
+        for result in self._execute_batch(sub_requests) or [None] * len(sub_requests):
+            records = _batch_result(result)
+            results.append(records[0] if isinstance(records, list) and records else None)
+        return results
+
+    def create_requested_items(self, items: list[dict]) -> list[dict | None] | None:
+        """Creates several ritms in as few round-trips as possible, using the Batch API.
+
+        Args:
+            items (List[Dict[str, Any]]): The keyword arguments of `create_requested_item`
+                for every ritm, e.g. {"assignment_group": ..., "short_description": ..., "description": ...}.
+
+        Returns:
+            self (Optional[List[Optional[Dict[str, Any]]]]): The created ritms in the order of `items`;
+            None for a ritm that was not created or whose outcome is unknown: after a timeout or a lost
+            response the instance may still have created it, so it must not be created again.
+            None instead of the list only if the batch call was provably never sent, in which
+            case the ritms can safely be created again.
+        """
+        endpoint_url = f"{self.api_path}/{self._RITM_ENDPOINT}"
+        logging.info(f"Attempting to create {len(items)} ritm(s) in batch")
+        results = self._execute_batch(
+            [("POST", endpoint_url, self._requested_item_payload(**item)) for item in items]
+        )
+        self._invalidate_table("sc_req_item")
+        if results is None:
+            return None
+        return [_batch_result(result) for result in results]
+
 
 class ServiceNowIntegrationClient(ServiceNowClient):
     def __init__(
-        self, url: str, username: str, password: str, integration_path: str
+        self, url: str, username: str, password: str, integration_path: str, warm_up: bool = False
     ):
         """Initializes the ServiceNowIntegrationClient.
 
@@ -1023,28 +1937,29 @@ class ServiceNowIntegrationClient(ServiceNowClient):
                 custom integrations, relative to the instance URL
                 (e.g., "api/my_company/integration_helper_v1").
                 Leading/trailing slashes will be removed.
+            warm_up (bool, optional): Passed on to `ServiceNowClient`. Defaults to False.
 
         Raises:
             ValueError: If 'integration_base_path' is empty or not provided.
         """
-        super().__init__(url, username, password)
+        super().__init__(url, username, password, warm_up=warm_up)
         if not integration_path:
             raise ValueError(
                 "Integration base path cannot be empty for ServiceNowIntegrationClient."
             )
-        self.integration_base_path = integration_path.lstrip("/")
-        self.integration_base_path = integration_path.rstrip("/")
+        self.integration_base_path = integration_path.strip("/")
+        self._integration_url = f"{self.url}/{self.integration_base_path}"
 
     def _build_integration_url(self) -> str:
         """Constructs the full URL for the configured integration endpoint.
 
-        This method combines the base instance URL with the specific
-        `integration_base_path` defined for this client.
+        The base instance URL and the specific `integration_base_path` defined
+        for this client are combined once, when the client is created.
 
         Returns:
             str: The fully constructed URL for the integration endpoint.
         """
-        return f"{self.url}/{self.integration_base_path}"
+        return self._integration_url
 
     def _make_integration_request(
         self, method: str, payload: dict = None
@@ -1077,15 +1992,17 @@ class ServiceNowIntegrationClient(ServiceNowClient):
         assignment_group: str = None,
         short_description: str = "Automated RITM Creation",
         description: str = "Base item created via integration helper.",
+        fetch_full: bool = False,
+        fields: list[str] = None,
     ) -> dict | None:
         """Creates a Requested Item (RITM) using a specific custom integration endpoint.
 
         This method sends a POST request to the configured integration endpoint
         to initiate the creation of an RITM. The structure of the payload and
         the response (especially the path to the created RITM number) are
-        dependent on the specific custom integration being called. After successful
-        creation via the helper, it attempts to fetch the full RITM details using
-        the standard API.
+        dependent on the specific custom integration being called. If the helper's
+        response already carries the RITM's sys_id, it is returned right away;
+        otherwise (or if `fetch_full` is set) the RITM is fetched using the standard API.
 
         Args:
             assignment_group (Optional[str], optional): Identifier for the assignment group.
@@ -1098,12 +2015,16 @@ class ServiceNowIntegrationClient(ServiceNowClient):
             extra_payload_fields (Optional[Dict[str, Any]], optional): Any additional
                 key-value pairs to include in the root of the JSON payload sent to
                 the integration endpoint. Defaults to None.
+            fetch_full (bool, optional): If True, the created RITM is always fetched
+                with the standard API. Defaults to False.
+            fields (Optional[List[str]], optional): The fields to fetch when the RITM
+                is looked up. Defaults to None (DEFAULT_FIELDS["sc_req_item"]).
 
 
         Returns:
-            self (Optional[Dict[str, Any]], optional): A dictionary representing the full details of the
-            newly created Requested Item (RITM) if successful, fetched using its number.
-            Returns None if the creation via the integration helper fails.
+            self (Optional[Dict[str, Any]], optional): A dictionary with the "number" and "sys_id"
+            of the newly created Requested Item (RITM), or its details fetched using its
+            number (see above). Returns None if the creation via the integration helper fails.
         """
 
         payload = {
@@ -1117,11 +2038,18 @@ class ServiceNowIntegrationClient(ServiceNowClient):
         except Exception as e:
             logging.error(f"Error creating RITM via integration helper: {e}")
             return None
+        self._invalidate_table("sc_req_item")
 
         if response and "result" in response:
             created_ritm = response["result"]["requestItemNumber"]
             logging.info(
                 f"Successfully created RITM via integration helper. RITM number: {created_ritm}"
             )
-            result = self.get_requested_item(number=created_ritm)
+            sys_id = response["result"].get("sys_id")
+            if sys_id and not fetch_full:
+                return {"number": created_ritm, "sys_id": sys_id}
+            # The number alone is not enough to update the RITM or attach files to it
+            result = self.get_requested_item(
+                number=created_ritm, fields=DEFAULT_FIELDS["sc_req_item"] if fields is None else fields
+            )
             return result
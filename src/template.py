@@ -1,13 +1,164 @@
-import tomllib
+import concurrent.futures
+import itertools
 import logging
 import os
-from datetime import datetime
+from collections.abc import Callable
+from datetime import date
 from typing import Optional
 
-from src.servicenow import ServiceNowClient, ServiceNowIntegrationClient
+from src import fasttoml
+from src.servicenow import ServiceNowClient, ServiceNowIntegrationClient, TTLCache
+
+
+# Names of the regular files in a directory, by directory.
+# Templates often share attachment directories, so each is listed once instead of one stat per attachment.
+DIR_LISTING_TTL = 5.0  # Seconds a directory listing is reused
+DIR_LISTING_MAXSIZE = 64
+_DIR_LISTINGS = TTLCache(maxsize=DIR_LISTING_MAXSIZE, ttl=DIR_LISTING_TTL)
+
+ATTACHMENT_UPLOAD_WORKERS = 4  # Attachments of one ticket uploaded at the same time
+BATCH_CREATE_SIZE = 20  # Tickets created per Batch API round-trip; a failed round-trip only affects these
+
+ATTACHMENT_LISTING_WORKERS = 8  # Attachment directories of one template listed at the same time
+
+# Top-level [ticket] fields load() copies onto the template, in the order _extract returns them
+_TICKET_FIELDS = ("assignment_group", "short_description", "description", "integration_helper")
+
+# --- Validation rules, built once at import instead of on every validate_structure call ---
+ALLOWED_FREQUENCIES = frozenset(["daily", "weekly", "monthly", "quarterly"])
+REQUIRED_STRING_FIELDS = ("short_description", "description", "assignment_group")
+# Fields each frequency needs in [ticket.schedule], and the error reported if any of them is missing
+SCHEDULE_REQUIRED_FIELDS = {
+    "weekly": (("day_of_week",), "'day_of_week' (integer) is missing for weekly frequency."),
+    "monthly": (("day_of_month",), "'day_of_month' (integer) is missing for monthly frequency."),
+    "quarterly": (
+        ("months", "day_of_month"),
+        "'months' (list of int) or 'day_of_month' (int) is missing for quarterly frequency.",
+    ),
+}
+
+
+def _files_in(directory: str) -> frozenset[str]:
+    """Returns the names of the regular files in `directory`, or an empty set if it can't be read.
+    Names are passed through os.path.normcase; see _file_exists for how they are matched."""
+    names = _DIR_LISTINGS.get(directory)
+    if names is not None:
+        return names
+
+    try:
+        with os.scandir(directory or ".") as entries:
+            names = frozenset(os.path.normcase(entry.name) for entry in entries if entry.is_file())
+    except OSError:
+        names = frozenset()
+    _DIR_LISTINGS.set(directory, names)
+    return names
+
+
+def _file_exists(file_path: str, names: frozenset[str]) -> bool:
+    """Checks `file_path` against `names`, the listing of its directory. A name missing from the listing is
+    confirmed with os.path.isfile, which covers directories that can't be listed (traverse-only permission)
+    and names that only match on a case-insensitive file system."""
+    return os.path.normcase(os.path.basename(file_path)) in names or os.path.isfile(file_path)
+
+
+def _extract(ticket_data: dict) -> tuple:
+    """Returns the _TICKET_FIELDS values of a [ticket] section, with None for missing ones."""
+    return tuple(map(ticket_data.get, _TICKET_FIELDS))
+
+
+def _list_directories(directories: set[str]) -> dict[str, frozenset[str]]:
+    """Lists several attachment directories at the same time, so slow (e.g. network mounted) ones are waited on
+    together instead of one after the other. Returns the listings by directory, see _files_in."""
+    if len(directories) < 2:
+        return {directory: _files_in(directory) for directory in directories}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(ATTACHMENT_LISTING_WORKERS, len(directories))) as pool:
+        return dict(zip(directories, pool.map(_files_in, directories)))
+
+
+def _read_file(path: str, size: int) -> bytes:
+    """Reads a whole file with unbuffered os.read calls; `size` is its size from os.stat."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))  # O_BINARY only exists (and matters) on Windows
+    try:
+        data = os.read(fd, size + 1)
+        while chunk := os.read(fd, 65536):  # Only if the file grew since it was stat-ed
+            data += chunk
+        return data
+    finally:
+        os.close(fd)
+
+
+def _schedule_errors(schedule: dict) -> list[str]:
+    """Checks a [ticket.schedule] section. Returns the errors found."""
+    if not schedule:
+        return ["'schedule' dictionary is empty or was missing."]
+    if not isinstance(schedule, dict):
+        return [f"'schedule' must be a table (found: {type(schedule)})."]
+
+    frequency = schedule.get("frequency")
+    if frequency is None:
+        return ["'frequency' is missing in [ticket.schedule]."]
+
+    # The type is checked first: a non-string (e.g. a list) can't be looked up in the set and dict below
+    if not isinstance(frequency, str) or frequency not in ALLOWED_FREQUENCIES:
+        return [f"Invalid 'frequency' value '{frequency}'. Allowed: {sorted(ALLOWED_FREQUENCIES)}"]
+
+    required = SCHEDULE_REQUIRED_FIELDS.get(frequency)
+    if required is not None:
+        field_names, missing_message = required
+        if any(schedule.get(name) is None for name in field_names):
+            return [missing_message]
+    return []
+
+
+def _never_due(today: date) -> bool:
+    return False
+
+
+def _due_predicate(schedule: dict) -> Callable[[date], bool]:
+    """
+    Builds the check of whether a ticket with this schedule is due on a given date, with the schedule's values
+    bound once. A schedule that is missing values (or has values of the wrong type) for its frequency is never due.
+    """
+    if not isinstance(schedule, dict):
+        return _never_due
+
+    frequency = schedule.get("frequency")
+    day_of_week = schedule.get("day_of_week")
+    day_of_month = schedule.get("day_of_month")
+    months = schedule.get("months")
+
+    if frequency == "daily":
+        return lambda today: today.weekday() < 5  # Monday to Friday
+    # type() rather than isinstance(): TOML values are never subclasses, and `true` is not a day number
+    if frequency == "weekly" and type(day_of_week) is int:
+        return lambda today: today.weekday() == day_of_week
+    if frequency == "monthly" and type(day_of_month) is int:
+        return lambda today: today.day == day_of_month
+    if frequency == "quarterly" and type(months) is list and type(day_of_month) is int:
+        try:
+            months = frozenset(months)
+        except TypeError:  # Unhashable items can never equal a month number
+            months = frozenset(month for month in months if type(month) is int)
+        return lambda today: today.day == day_of_month and today.month in months
+    return _never_due
 
 
 class TicketTemplate:
+    # No per-instance __dict__: smaller instances and faster attribute access
+    __slots__ = (
+        "template_path",
+        "assignment_group",
+        "short_description",
+        "description",
+        "integration_helper",
+        "schedule",
+        "attachments",
+        "validation_errors",
+        "_is_due",
+        "_needs_integration",
+        "_attachment_items",
+    )
+
     def __init__(self, template_path: str):
         self.template_path = template_path
 
@@ -18,131 +169,175 @@ class TicketTemplate:
         self.integration_helper = None
         self.schedule = {}  # Default to empty dict for the schedule
         self.attachments = []  # Default to empty list for the files
+        self._is_due = _never_due  # Replaced by load() with a check specialized for the schedule
+        self._needs_integration = False  # Set by load(): whether the RITM is created by the integration helper
+        self._attachment_items = []  # [ticket.attachments] files as loaded; validate_structure sets attachments from it
 
         self.validation_errors = []  # For storing validation messages
 
-    def _create_via_integration_helper(self, sn_integration_client: ServiceNowIntegrationClient) -> Optional[dict]:
-        """Creates a base RITM using the ServiceNowIntegrationClient."""
-        logging.info(f"Attempting RITM creation via integration helper for template '{self.template_path}'.")
-        
-        ritm_data = sn_integration_client.create_requested_item(
-            assignment_group=self.assignment_group,
-            short_description="Scheduled ticket",
-            description="Scheduled ticket"
-        )
-        
+    def _ritm_fields(self) -> dict:
+        """
+        Returns the fields the RITM is created with. The integration helper creates a base RITM with placeholder
+        descriptions, which _finalize_details replaces; the primary API gets the final descriptions right away.
+        """
+        if self._needs_integration:
+            return {
+                "assignment_group": self.assignment_group,
+                "short_description": "Scheduled ticket",
+                "description": "Scheduled ticket",
+            }
+        return {"assignment_group": self.assignment_group, **self._details_payload()}
+
+    def _details_payload(self) -> dict:
+        """Returns the fields set on the RITM once it has been created."""
+        return {
+            "short_description": self.short_description,
+            "description": self.description,
+        }
+
+    def _created_ritm(self, ritm_data: Optional[dict], via: str) -> Optional[tuple[str, dict]]:
+        """Logs the outcome of a RITM creation. Returns (sys_id, ritm_data), or None if no RITM with a sys_id was created."""
         if not ritm_data:
-            logging.error(f"RITM creation via integration helper FAILED for template '{self.template_path}'.")
+            logging.error("RITM creation via %s FAILED for template '%s'.", via, self.template_path)
             return None
-        
+
         sys_id = ritm_data.get("sys_id")
         ritm_number = ritm_data.get("number", "N/A")
-        logging.info(f"Base RITM {ritm_number} (SysID: {sys_id}) created via integration helper for '{self.template_path}'.")
-        return ritm_data
+        if not sys_id:
+            logging.error(
+                "RITM %s created via %s for '%s' has no sys_id; it can't be finalized.", ritm_number, via, self.template_path
+            )
+            return None
 
-    def _create_via_api(self, sn_api_client: ServiceNowClient) -> Optional[dict]:
-        """Creates a base RITM using the ServiceNow API client."""
-        logging.info(f"Attempting RITM creation via primary API for template '{self.template_path}'.")
+        logging.info("Base RITM %s (SysID: %s) created via %s for '%s'.", ritm_number, sys_id, via, self.template_path)
+        return sys_id, ritm_data
 
-        ritm_data = sn_api_client.create_requested_item(
-            assignment_group=self.assignment_group,
-            short_description="Scheduled ticket",
-            description="Scheduled ticket"
-        )
+    def _create(self, client: ServiceNowClient) -> Optional[tuple[str, dict]]:
+        """
+        Creates the RITM with `client`: the ServiceNowIntegrationClient if the template uses the integration helper,
+        the ServiceNow API client otherwise. Returns (sys_id, ritm_data), or None on failure.
+        """
+        via = "integration helper" if self._needs_integration else "primary API"
+        logging.info("Attempting RITM creation via %s for template '%s'.", via, self.template_path)
 
-        if not ritm_data:
-            logging.error(f"RITM creation via primary API FAILED for template '{self.template_path}'.")
-            return None
-
-        sys_id = ritm_data.get("sys_id")
-        ritm_number = ritm_data.get("number", "N/A")
-        logging.info(f"Base RITM {ritm_number} (SysID: {sys_id}) created via primary API for '{self.template_path}'.")
-        return ritm_data
+        ritm_data = client.create_requested_item(**self._ritm_fields())
+        return self._created_ritm(ritm_data, via)
 
     def _finalize_details(self, sn_api_client: ServiceNowClient, ticket_sys_id: str) -> None:
         """
-        Updates the created RITM with short_description, description, and adds attachments using the API client.
-        Returns True if all steps were attempted, False otherwise (though critical failures handled by client).
+        Updates the created RITM with short_description and description, and adds attachments using the API client.
+        The update is only needed for RITMs created by the integration helper, which sets placeholder descriptions.
         """
 
         # --- Update with Short Description and Description ---
-        payload = {
-            "short_description": self.short_description,
-            "description": self.description        }
-
-        sn_api_client.update_ticket(
-            table_name="sc_req_item", sys_id=ticket_sys_id, payload=payload
-        )
-
-        # --- Add Attachments ---
-        if self.attachments:
-            logging.info(f"Adding {len(self.attachments)} attachment(s).")
-            for attachment_info in self.attachments:
-                file_path = attachment_info.get("path")
-                sn_api_client.add_attachment(
-                    table_name="sc_req_item", sys_id=ticket_sys_id, file_path=file_path
-                )
+        if self._needs_integration:
+            sn_api_client.update_ticket(
+                table_name="sc_req_item", sys_id=ticket_sys_id, payload=self._details_payload()
+            )
+
+        self._add_attachments(sn_api_client, ticket_sys_id)
+
+    def _add_attachments(self, sn_api_client: ServiceNowClient, ticket_sys_id: str) -> None:
+        """Uploads the template's attachments to the created RITM, up to ATTACHMENT_UPLOAD_WORKERS at a time."""
+        if not self.attachments:
+            return
+
+        logging.info("Adding %d attachment(s).", len(self.attachments))
+
+        def upload(attachment_info: dict) -> Optional[dict]:
+            return sn_api_client.add_attachment(
+                table_name="sc_req_item", sys_id=ticket_sys_id, file_path=attachment_info.get("path")
+            )
 
+        if len(self.attachments) == 1:
+            upload(self.attachments[0])
+            return
+
+        workers = min(ATTACHMENT_UPLOAD_WORKERS, len(self.attachments))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(upload, self.attachments))
+
+    def _file_not_found(self) -> bool:
+        """Records that the template file does not exist. Always returns False, the result of load()."""
+        logging.error("Error: Template file %s not found.", self.template_path)
+        self.validation_errors.append(f"File not found: {self.template_path}")
+        return False
 
     def load(self) -> bool:
         """Loads the TOML template file and extracts the 'ticket' section."""
 
+        toml_loads, toml_decode_errors = fasttoml.backend()
+
         try:
-            with open(self.template_path, "rb") as f:
-                template = tomllib.load(f)
+            stat = os.stat(self.template_path)
+        except FileNotFoundError:  # Checked on its own, so a missing file never unwinds the parsing code below
+            return self._file_not_found()
+
+        try:
+            # One read of the whole file, without a buffered file object
+            raw = _read_file(self.template_path, stat.st_size)
+            template = toml_loads(raw.decode("utf-8"))
 
             if "ticket" not in template:
                 msg = f"'ticket' section not found in template {self.template_path}."
-                logging.error(f"Error: {msg}")
+                logging.error("Error: %s", msg)
                 self.validation_errors.append(msg)
                 return False
 
             ticket_data = template["ticket"]
 
-            self.assignment_group = ticket_data.get("assignment_group")
-            self.short_description = ticket_data.get("short_description")
-            self.description = ticket_data.get("description")
-            self.integration_helper = ticket_data.get("integration_helper")
+            (
+                self.assignment_group,
+                self.short_description,
+                self.description,
+                self.integration_helper,
+            ) = _extract(ticket_data)
+            self._needs_integration = bool(self.integration_helper)
             self.schedule = ticket_data.get("schedule", {})
+            self._is_due = _due_predicate(self.schedule)
+            if self._is_due is _never_due:
+                # Only due templates get validated, so a broken schedule is reported here or never
+                self._report_schedule_errors()
 
             attachments_data = ticket_data.get("attachments", {})
-            self.attachments = attachments_data.get("files", [])
+            self._attachment_items = attachments_data.get("files", [])
+            self.attachments = self._attachment_items
 
-            logging.debug(self.__dict__)
+            if logging.root.isEnabledFor(logging.DEBUG):  # Skip the repr of the whole template otherwise
+                logging.debug("%r", {name: getattr(self, name) for name in self.__slots__})
             return True
 
-        except FileNotFoundError:
-            logging.error(f"Error: Template file {self.template_path} not found.")
-            self.validation_errors.append(f"File not found: {self.template_path}")
-            return False
+        except FileNotFoundError:  # Removed after it was stat-ed
+            return self._file_not_found()
 
-        except tomllib.TOMLDecodeError as e:
-            logging.error(f"Error decoding TOML from {self.template_path}: {e}")
+        except toml_decode_errors as e:
+            logging.error("Error decoding TOML from %s: %s", self.template_path, e)
             self.validation_errors.append(f"TOML decode error: {e}")
             return False
 
         except Exception as e:
-            logging.error(
-                f"Unexpected error while loading template {self.template_path}: {e}"
-            )
+            logging.error("Unexpected error while loading template %s: %s", self.template_path, e)
             self.validation_errors.append(f"Unexpected loading error: {e}")
             return False
 
-    def validate_structure(self) -> bool:
-        """Validates the structure and basic fields of the loaded template data.
-        Returns True if the structure is valid, False otherwise.
-        This method should be called after load() to ensure the template is loaded first.
-        """
+    def _report_schedule_errors(self) -> None:
+        """Logs why the template's schedule can never be due, and records it in validation_errors."""
+        errors = _schedule_errors(self.schedule)
+        if not errors:  # Present but of the wrong type, e.g. day_of_week = "1"
+            errors = [f"[ticket.schedule] values have the wrong type, the ticket is never due: {self.schedule!r}"]
+        self.validation_errors.extend(errors)
+        for err in errors:
+            logging.error("Schedule error in %s: %s", self.template_path, err)
+
+    def _structure_errors(self) -> tuple[tuple[str, ...], tuple[int, ...]]:
+        """Checks the loaded fields, without touching the filesystem.
+        Returns the errors found and the indices of the well-formed attachment items."""
 
         current_errors = []
 
         # --- Validate top-level fields ---
-        required_fields_map = {
-            "short_description": self.short_description,
-            "description": self.description,
-            "assignment_group": self.assignment_group,
-        }
-        for field_name, field_value in required_fields_map.items():
+        for field_name in REQUIRED_STRING_FIELDS:
+            field_value = getattr(self, field_name)
             if field_value is None:
                 current_errors.append(f"'{field_name}' is missing or null.")
             elif not isinstance(field_value, str):
@@ -157,84 +352,66 @@ class TicketTemplate:
             )
 
         # --- Validate 'schedule' ---
-        if not self.schedule:
-            current_errors.append("'schedule' dictionary is empty or was missing.")
-        else:
-            frequency = self.schedule.get("frequency")
-            if frequency is None:
-                current_errors.append("'frequency' is missing in [ticket.schedule].")
-            else:
-                allowed_frequencies = ["daily", "weekly", "monthly", "quarterly"]
-                if frequency not in allowed_frequencies:
-                    current_errors.append(
-                        f"Invalid 'frequency' value '{frequency}'. Allowed: {allowed_frequencies}"
-                    )
-
-                if frequency == "weekly" and self.schedule.get("day_of_week") is None:
-                    current_errors.append(
-                        "'day_of_week' (integer) is missing for weekly frequency."
-                    )
-                elif (
-                    frequency == "monthly" and self.schedule.get("day_of_month") is None
-                ):
-                    current_errors.append(
-                        "'day_of_month' (integer) is missing for monthly frequency."
-                    )
-                elif frequency == "quarterly" and (
-                    self.schedule.get("months") is None
-                    or self.schedule.get("day_of_month") is None
-                ):
-                    current_errors.append(
-                        "'months' (list of int) or 'day_of_month' (int) is missing for quarterly frequency."
-                    )
-
-        # --- Validate 'attachments' ---
-        processed_attachments = []
-        for index, file_item in enumerate(self.attachments):
-            if not isinstance(file_item, dict):
-                        current_errors.append(f"Attachment item at index {index} is not a dictionary.")
-                        continue
-
-            file_path = file_item.get("path")
-            is_file_required = file_item.get("required")
+        current_errors.extend(_schedule_errors(self.schedule))
 
-            # Validate path and required 
-            valid_file_path_str = isinstance(file_path, str) and file_path
-            valid_is_file_required_bool = isinstance(is_file_required, bool)
+        # --- Validate 'attachments' items ---
+        valid_items = []
+        for index, file_item in enumerate(self._attachment_items):
+            if type(file_item) is not dict:
+                current_errors.append(f"Attachment item at index {index} is not a dictionary.")
+                continue
 
+            get = file_item.get
+            file_path = get("path")
+            is_file_required = get("required")
+
+            # Validate path and required; the messages are only built for a structurally flawed item, which is skipped
+            if type(file_path) is not str or not file_path or type(is_file_required) is not bool:
+                if file_path is None:
+                    current_errors.append(f"'path' is missing or null in attachment item at index {index}.")
+                elif type(file_path) is not str or not file_path:
+                    current_errors.append(f"'path' in attachment item at index {index} must be a non-empty string.")
+
+                if is_file_required is None:
+                    current_errors.append(f"'required' is missing or null in attachment item at index {index}.")
+                elif type(is_file_required) is not bool:
+                    current_errors.append(f"'required' in attachment item at index {index} must be a boolean (true/false).")
+                continue
 
-            if file_path is None:
-                current_errors.append(f"'path' is missing or null in attachment item at index {index}.")
-            elif not valid_file_path_str:
-                current_errors.append(f"'path' in attachment item at index {index} must be a non-empty string.")
+            valid_items.append(index)
 
-            if is_file_required is None:
-                current_errors.append(f"'required' is missing or null in attachment item at index {index}.")
-            elif not valid_is_file_required_bool:
-                current_errors.append(f"'required' in attachment item at index {index} must be a boolean (true/false).")
+        return tuple(current_errors), tuple(valid_items)
 
+    def validate_structure(self) -> bool:
+        """Validates the structure and basic fields of the loaded template data.
+        Returns True if the structure is valid, False otherwise.
+        This method should be called after load() to ensure the template is loaded first.
+        """
 
-            # If basic structure of path/required is invalid for this item, skip
-            # This item is structurally flawed
-            if not (valid_file_path_str and valid_is_file_required_bool):
-                continue
+        structure_errors, valid_items = self._structure_errors()
+        current_errors = list(structure_errors)
 
-            file_exists = os.path.isfile(file_path)
+        # --- Check that the attachment files exist ---
+        # Only templates that are due get here, so the directories of the others are never listed
+        # valid_items index the attachments as loaded, not the filtered list a previous call left in self.attachments
+        items = self._attachment_items
+        listings = _list_directories({os.path.dirname(items[index]["path"]) for index in valid_items})
+        processed_attachments = []
+        for index in valid_items:
+            file_item = items[index]
+            file_path = file_item["path"]
 
-            if is_file_required is True:
-                if not file_exists:
-                    current_errors.append(
-                        f"Required attachment file '{file_path}' (item at index {index}) does not exist."
-                    )
-                else:
-                    processed_attachments.append(file_item)
+            if _file_exists(file_path, listings[os.path.dirname(file_path)]):
+                processed_attachments.append(file_item)
+            elif file_item["required"]:
+                current_errors.append(
+                    f"Required attachment file '{file_path}' (item at index {index}) does not exist."
+                )
             else:
-                if not file_exists:
-                    logging.warning(
-                        f"Optional attachment file '{file_path}' (item at index {index}) does not exist for template '{self.template_path}'. It will be skipped."
-                    )
-                else:
-                    processed_attachments.append(file_item)
+                logging.warning(
+                    "Optional attachment file '%s' (item at index %d) does not exist for template '%s'. It will be skipped.",
+                    file_path, index, self.template_path,
+                )
 
         self.attachments = processed_attachments
 
@@ -242,59 +419,79 @@ class TicketTemplate:
         if current_errors:
             self.validation_errors.extend(current_errors)
             for err in current_errors:
-                logging.error(f"Validation error in {self.template_path}: {err}")
+                logging.error("Validation error in %s: %s", self.template_path, err)
             return False
 
-        logging.debug(
-            f"Template structure validation successful for {self.template_path}."
-        )
+        logging.debug("Template structure validation successful for %s.", self.template_path)
         return True
 
-    def is_due(self, today: datetime) -> bool:
-        """Checks if the loaded ticket template is due to be created today."""
-
-        frequency = self.schedule.get("frequency")
-        if frequency == "daily":
-            return today.weekday() < 5  # Monday to Friday
-        elif frequency == "weekly":
-            day_of_week = self.schedule.get("day_of_week")
-            return isinstance(day_of_week, int) and today.weekday() == day_of_week
-        elif frequency == "monthly":
-            day_of_month = self.schedule.get("day_of_month")
-            return isinstance(day_of_month, int) and today.day == day_of_month
-        elif frequency == "quarterly":
-            months = self.schedule.get("months")
-            day_of_month = self.schedule.get("day_of_month")
-            return (
-                isinstance(months, list)
-                and isinstance(day_of_month, int)
-                and today.month in months
-                and today.day == day_of_month
-            )
-        return False
-
-    def create_ticket(self, sn_api_client: ServiceNowClient, sn_integration_client: Optional[ServiceNowIntegrationClient] = None) -> bool:
+    def is_due(self, today: date) -> bool:
+        """Checks if the loaded ticket template is due to be created today.
+        Only the date part of `today` is used, so a datetime works as well.
+        The check itself is built once by load(), see _due_predicate."""
+        return self._is_due(today)
+
+    def create_ticket(
+        self,
+        sn_api_client: ServiceNowClient,
+        sn_integration_client: Optional[Callable[[], Optional[ServiceNowIntegrationClient]]] = None,
+    ) -> bool:
         """
         Orchestrates the creation of a single scheduled ticket.
         Decides whether to use the integration helper or standard API for initial creation, then always uses the standard API for updates and attachments.
+        `sn_integration_client` is a factory; it is only called when the template needs the integration helper.
         Returns True if the ticket creation and finalization process was successfully initiated, False on critical creation failure.
         """
-        ticket_base: Optional[dict] = None
-
-        if self.integration_helper:
-            if sn_integration_client:
-                ticket_base = self._create_via_integration_helper(sn_integration_client)
-            else:
+        client = sn_api_client
+        if self._needs_integration:
+            client = sn_integration_client() if sn_integration_client else None
+            if not client:
                 logging.error(
-                    f"Template '{self.template_path}' requires an integration client (integration_helper is true), but no integration client is configured/available. Skipping ticket creation."
+                    "Template '%s' requires an integration client (integration_helper is true), but no integration client is configured/available. Skipping ticket creation.",
+                    self.template_path,
                 )
                 return False
-        else:
-            ticket_base = self._create_via_api(sn_api_client)
 
-        if not ticket_base:
+        created = self._create(client)
+        if created is None:
             return False
 
-        ticket_sys_id = ticket_base.get("sys_id")
-        return self._finalize_details(sn_api_client, ticket_sys_id)
+        ticket_sys_id, _ = created
+        self._finalize_details(sn_api_client, ticket_sys_id)
+        return True
+
+
+def create_tickets_in_batch(templates: list[TicketTemplate], sn_api_client: ServiceNowClient) -> list[bool]:
+    """
+    Creates the tickets of several templates that use the primary API, sharing round-trips between them.
+    The RITMs are created, with their final descriptions, in Batch API calls of up to BATCH_CREATE_SIZE tickets
+    instead of one call per template. Only if a batch call was provably never sent do its templates fall back to
+    create_ticket; any other failure may have created the RITMs already, so those templates are not retried.
+    Attachments are then uploaded per ticket, as the Batch API only carries JSON bodies.
+    Templates with integration_helper set must go through create_ticket instead.
+    Returns one entry per template: True if its ticket was created, False otherwise.
+    """
+    results = []
+    for chunk in itertools.batched(templates, BATCH_CREATE_SIZE):
+        logging.info("Attempting RITM creation via primary API for %d template(s) in batch.", len(chunk))
+        created = sn_api_client.create_requested_items([template._ritm_fields() for template in chunk])
+
+        if created is None:
+            logging.error(
+                "Batch RITM creation was not sent for %d template(s); creating their tickets one at a time.", len(chunk)
+            )
+            results.extend(template.create_ticket(sn_api_client) for template in chunk)
+            continue
+        if not any(created):
+            logging.error(
+                "Batch RITM creation FAILED or has an unknown outcome for template(s): %s. They are not retried, as "
+                "ServiceNow may have created their RITMs; check before creating them by hand.",
+                ", ".join(template.template_path for template in chunk),
+            )
 
+        for template, ritm_data in zip(chunk, created):
+            ritm = template._created_ritm(ritm_data, "primary API")
+            if ritm is not None:
+                template._add_attachments(sn_api_client, ritm[0])
+            results.append(ritm is not None)
+    return results